@@ -35,39 +35,209 @@ def test_db_init():
 
 
 def test_startup_missing_direct_reports_json():
-    """Startup succeeds when direct_reports.json is missing; file is created with empty list."""
+    """Startup succeeds when direct_reports.jsonl is missing; an empty journal is created."""
     td = tempfile.mkdtemp(prefix="wingmanem_dr_")
-    dr_file = os.path.join(td, "direct_reports.json")
+    dr_file = os.path.join(td, "direct_reports.jsonl")
     assert not os.path.exists(dr_file)
     import wingmanem.app as app
     with patch("wingmanem.app.DIRECT_REPORTS_FILE", dr_file), patch(
-        "wingmanem.app.DATABASE_PATH", os.path.join(td, "test.db")
+        "wingmanem.app.LEGACY_DIRECT_REPORTS_FILE", os.path.join(td, "direct_reports.json")
+    ), patch("wingmanem.app.DATABASE_PATH", os.path.join(td, "test.db")), patch.multiple(
+        app, direct_reports=[{"id": 9}], _direct_report_id_counter=0, _direct_reports_journal_lines=0
     ):
         app._db_init()
         app._load_direct_reports()
+        assert app.direct_reports == []
     assert os.path.isfile(dr_file)
-    with open(dr_file, encoding="utf-8") as f:
-        data = json.load(f)
-    assert data == []
-    assert app.direct_reports == []
+    assert app._read_direct_reports_file(dr_file) == []
+
+
+def test_direct_report_name_key_cached_not_persisted():
+    """Cached _name_key is used for duplicate checks but never written to direct_reports.jsonl."""
+    td = tempfile.mkdtemp(prefix="wingmanem_dr_")
+    dr_file = os.path.join(td, "direct_reports.jsonl")
+    import wingmanem.app as app
+    r = app._cache_direct_report_name_key(
+        app._normalize_direct_report({"id": 1, "first_name": " Ada ", "last_name": "Lovelace"})
+    )
+    assert r["_name_key"] == "ada|lovelace"
+    assert app._is_duplicate_direct_report({"first_name": "ADA", "last_name": "lovelace "}, {r["_name_key"]})
+    with patch("wingmanem.app.DIRECT_REPORTS_FILE", dr_file):
+        app._write_direct_reports_json_file([r])
+    data = app._read_direct_reports_file(dr_file)
+    assert "_name_key" not in data[0]
+
+
+def test_next_direct_report_id_counter_seeded_at_load():
+    """Loading reports seeds the id counter past the max id; each call hands out a fresh id."""
+    td = tempfile.mkdtemp(prefix="wingmanem_dr_")
+    dr_file = os.path.join(td, "direct_reports.json")
+    with open(dr_file, "w", encoding="utf-8") as f:
+        json.dump([{"id": 2, "first_name": "A", "last_name": "B"}, {"id": 5, "first_name": "C", "last_name": "D"}], f)
+    import wingmanem.app as app
+    # patch.multiple restores the module state _load_direct_reports replaces, so test order doesn't matter
+    with patch("wingmanem.app.DIRECT_REPORTS_FILE", dr_file), patch("wingmanem.app._db_available", False), patch.multiple(
+        app, direct_reports=[], _direct_report_id_counter=0, _direct_reports_journal_lines=0
+    ):
+        app._load_direct_reports()
+        assert app._next_direct_report_id() == 6
+        assert app._next_direct_report_id() == 7
+
+
+def test_direct_reports_journal_append_replay_and_compact():
+    """Legacy JSON array migrates to the journal; add/delete append lines; replay matches memory."""
+    td = tempfile.mkdtemp(prefix="wingmanem_dr_")
+    dr_file = os.path.join(td, "direct_reports.jsonl")
+    legacy = os.path.join(td, "direct_reports.json")
+    with open(legacy, "w", encoding="utf-8") as f:
+        json.dump([{"id": 1, "firstName": "A", "lastName": "B"}, {"id": 2, "first_name": "C", "last_name": "D"}], f)
+    import wingmanem.app as app
+    with patch("wingmanem.app.DIRECT_REPORTS_FILE", dr_file), patch(
+        "wingmanem.app.LEGACY_DIRECT_REPORTS_FILE", legacy
+    ), patch("wingmanem.app._db_available", False), patch.multiple(
+        app, direct_reports=[], _direct_report_id_counter=0, _direct_reports_journal_lines=0
+    ):
+        app._load_direct_reports()
+        assert not os.path.exists(legacy)
+        new = app._normalize_direct_report({"id": app._next_direct_report_id(), "first_name": "E", "last_name": "F"})
+        app.direct_reports.append(new)
+        app._save_direct_reports([app._direct_report_add_op(new)])
+        del app.direct_reports[0]
+        app._save_direct_reports([{"op": "del", "id": 1}])
+        with open(dr_file, encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == 4
+        assert app._read_direct_reports_file(dr_file) == [app._persisted_direct_report(r) for r in app.direct_reports]
+        # Journal past the ratio is rewritten as one line per live report
+        for _ in range(8):
+            app._save_direct_reports([{"op": "del", "id": 99}])
+        with open(dr_file, encoding="utf-8") as f:
+            assert len(f.read().splitlines()) <= 2 * app._DIRECT_REPORTS_JOURNAL_COMPACT_RATIO
+        assert [r["id"] for r in app._read_direct_reports_file(dr_file)] == [2, 3]
+
+
+def test_direct_reports_journal_torn_multibyte_line_is_skipped():
+    """A last line cut inside a UTF-8 character is skipped by the stdlib json path, not a crash."""
+    td = tempfile.mkdtemp(prefix="wingmanem_dr_")
+    dr_file = os.path.join(td, "direct_reports.jsonl")
+    good = json.dumps({"op": "add", "rec": {"id": 1, "first_name": "Zoë", "last_name": "B"}}, ensure_ascii=False)
+    with open(dr_file, "wb") as f:
+        torn = good.replace("1", "2").encode("utf-8")
+        f.write(good.encode("utf-8") + b"\n" + torn[:torn.index(b"\xc3") + 1])
+    import wingmanem.app as app
+    with patch.object(app, "_orjson", None), patch.object(app, "DIRECT_REPORTS_FILE", dr_file), patch.object(
+        app, "_db_available", False
+    ), patch.multiple(app, direct_reports=[], _direct_report_id_counter=0, _direct_reports_journal_lines=0):
+        assert [r["id"] for r in app._read_direct_reports_file(dr_file)] == [1]
+        app._load_direct_reports()
+        assert [r["first_name"] for r in app.direct_reports] == ["Zoë"]
+
+
+def test_generate_direct_reports_with_ai_skips_duplicates():
+    """AI-generated reports matching an existing name (case/space-insensitive) are skipped."""
+    from unittest.mock import MagicMock
+
+    import wingmanem.app as app
+    reply = json.dumps({"reports": [
+        {"first_name": " ada", "last_name": "LOVELACE"},
+        {"first_name": "Grace", "last_name": "Hopper"},
+    ]})
+    client = MagicMock()
+    client.chat.complete.return_value.choices[0].message.content = reply
+    existing = app._cache_direct_report_name_key(
+        app._normalize_direct_report({"id": 1, "first_name": "Ada", "last_name": "Lovelace"})
+    )
+    with patch.object(app, "direct_reports", [existing]), patch.object(app, "MISTRAL_AVAILABLE", True), patch.object(
+        app, "Mistral", return_value=client
+    ), patch("wingmanem.app._get_mistral_api_key", return_value="k"), patch(
+        "wingmanem.app._clear_screen"
+    ), patch("wingmanem.app._save_direct_reports"), patch("builtins.input", return_value="2"), patch(
+        "sys.stdout", new_callable=StringIO
+    ):
+        app._generate_direct_reports_with_ai()
+        names = [(r["first_name"], r["last_name"]) for r in app.direct_reports]
+    assert names == [("Ada", "Lovelace"), ("Grace", "Hopper")]
 
 
 def test_startup_missing_management_tips_json():
-    """Startup succeeds when management_tips.json is missing; file is created (empty or with tip)."""
+    """Startup succeeds when management_tips.ndjson is missing; file is created (empty or with tip)."""
     td = tempfile.mkdtemp(prefix="wingmanem_tips_")
-    tips_file = os.path.join(td, "management_tips.json")
+    tips_file = os.path.join(td, "management_tips.ndjson")
     assert not os.path.exists(tips_file)
     import wingmanem.app as app
     with patch("wingmanem.app.MANAGEMENT_TIPS_FILE", tips_file), patch(
+        "wingmanem.app.LEGACY_MANAGEMENT_TIPS_FILE", os.path.join(td, "management_tips.json")
+    ), patch(
         "wingmanem.app.DATABASE_PATH", os.path.join(td, "test.db")
-    ), patch("wingmanem.app._generate_management_tip_with_ai"):  # avoid Mistral call
+    ), patch("wingmanem.app._generate_management_tip_with_ai"), patch.object(  # avoid Mistral call
+        app, "management_tips", []
+    ):
         app._db_init()
         app._load_management_tips()
-    assert os.path.isfile(tips_file)
-    with open(tips_file, encoding="utf-8") as f:
-        data = json.load(f)
-    assert isinstance(data, list)
-    assert app.management_tips == data
+        assert os.path.isfile(tips_file)
+        with open(tips_file, encoding="utf-8") as f:
+            data = [json.loads(line) for line in f if line.strip()]
+        assert app.management_tips == data
+
+
+def test_management_tips_legacy_json_migrated_and_appended():
+    """Legacy management_tips.json array is migrated to NDJSON; new tips are appended as lines."""
+    td = tempfile.mkdtemp(prefix="wingmanem_tips_")
+    legacy = os.path.join(td, "management_tips.json")
+    tips_file = os.path.join(td, "management_tips.ndjson")
+    with open(legacy, "w", encoding="utf-8") as f:
+        json.dump([{"date": "2024-01-01", "text": "Old tip"}], f)
+    import wingmanem.app as app
+    with patch("wingmanem.app.MANAGEMENT_TIPS_FILE", tips_file), patch(
+        "wingmanem.app.LEGACY_MANAGEMENT_TIPS_FILE", legacy
+    ), patch("wingmanem.app._db_available", False), patch("wingmanem.app._generate_management_tip_with_ai"), patch.object(
+        app, "management_tips", []
+    ):
+        app._load_management_tips()
+        app._append_management_tip({"date": "2024-01-02", "text": "New tip"})
+        assert not os.path.exists(legacy)
+        assert [t["text"] for t in app._read_management_tips_file(tips_file)] == ["Old tip", "New tip"]
+
+
+def test_management_tips_failed_migration_keeps_legacy_file():
+    """An OSError partway through writing the NDJSON file leaves no tips file and keeps the legacy one."""
+    td = tempfile.mkdtemp(prefix="wingmanem_tips_")
+    legacy = os.path.join(td, "management_tips.json")
+    tips_file = os.path.join(td, "management_tips.ndjson")
+    with open(legacy, "w", encoding="utf-8") as f:
+        json.dump([{"date": f"2024-01-0{i}", "text": f"Tip {i}"} for i in range(1, 6)], f)
+    import wingmanem.app as app
+    real_json_line = app._json_line
+    calls = []
+
+    def failing_json_line(obj):
+        calls.append(obj)
+        if len(calls) == 3:
+            raise OSError(28, "No space left on device")
+        return real_json_line(obj)
+
+    with patch.object(app, "MANAGEMENT_TIPS_FILE", tips_file), patch.object(
+        app, "LEGACY_MANAGEMENT_TIPS_FILE", legacy
+    ), patch.object(app, "_json_line", failing_json_line), patch("sys.stderr", new_callable=StringIO):
+        app._migrate_management_tips_json_file()
+    assert os.path.isfile(legacy)
+    assert not os.path.exists(tips_file)
+
+
+def test_management_tips_torn_multibyte_line_is_skipped():
+    """A final tip append cut inside a UTF-8 character (’) is skipped on load, not a startup crash."""
+    td = tempfile.mkdtemp(prefix="wingmanem_tips_")
+    tips_file = os.path.join(td, "management_tips.ndjson")
+    good = json.dumps({"date": "2024-01-01", "text": "Don’t skip 1:1s"}, ensure_ascii=False).encode("utf-8")
+    with open(tips_file, "wb") as f:
+        f.write(good + b"\n" + good[:good.index("’".encode("utf-8")) + 1])
+    import wingmanem.app as app
+    with patch.object(app, "_orjson", None), patch.object(app, "MANAGEMENT_TIPS_FILE", tips_file), patch.object(
+        app, "LEGACY_MANAGEMENT_TIPS_FILE", os.path.join(td, "management_tips.json")
+    ), patch.object(app, "_db_available", False), patch.object(app, "management_tips", []), patch(
+        "wingmanem.app._generate_management_tip_with_ai"
+    ):
+        app._load_management_tips()
+        assert [t["text"] for t in app.management_tips] == ["Don’t skip 1:1s"]
 
 
 def test_build_main_menu():
@@ -80,6 +250,14 @@ def test_build_main_menu():
     assert "Exit" in menu
 
 
+def test_lazy_menu_module_attributes():
+    """The old module-level menu names still resolve (built on first access via module __getattr__)."""
+    import wingmanem.app as app
+    for name in ("DEVELOPER_MENU", "PROJECT_MENU", "ONE_TO_ONE_MENU", "PEOPLE_MENU", "DIRECT_REPORTS_MENU"):
+        assert getattr(app, name).startswith("╔")
+    assert "Administer Direct Reports" in app.DIRECT_REPORTS_MENU
+
+
 def test_get_latest_management_tip():
     """Get latest tip returns a string (placeholder if none)."""
     import wingmanem.app as app
@@ -105,6 +283,40 @@ def test_print_management_tips_by_date_empty():
     assert True
 
 
+def test_generate_management_tip_skips_normalized_duplicates():
+    """A tip matching history up to case/whitespace is rejected and the next suggestion is kept."""
+    from unittest.mock import MagicMock
+
+    import wingmanem.app as app
+    client = MagicMock()
+    replies = ["hold  WEEKLY 1:1s.", "Delegate more."]
+    client.chat.complete.side_effect = lambda **_: MagicMock(
+        choices=[MagicMock(message=MagicMock(content=replies.pop(0)))]
+    )
+    td = tempfile.mkdtemp(prefix="wingmanem_tips_")
+    with patch.object(app, "management_tips", [{"date": "2024-01-01", "text": "Hold weekly 1:1s."}]), patch(
+        "wingmanem.app._ensure_mistral_sdk", return_value=True
+    ), patch("wingmanem.app._get_mistral_api_key", return_value="k"), patch(
+        "wingmanem.app._get_mistral_client", return_value=client
+    ), patch("wingmanem.app._db_available", False), patch(
+        "wingmanem.app.MANAGEMENT_TIPS_FILE", os.path.join(td, "management_tips.ndjson")
+    ):
+        assert app._generate_management_tip_with_ai(silent=True) is True
+        assert [t["text"] for t in app.management_tips] == ["Hold weekly 1:1s.", "Delegate more."]
+        # CLI tips keep the loader's {"date", "text"} shape (no owner_user_id: null written on a later save)
+        assert set(app.management_tips[-1]) == {"date", "text"}
+    assert client.chat.complete.call_count == 2
+
+
+def test_parse_mistral_json_objects_fenced_and_keyed():
+    """Mistral JSON replies parse with or without a code fence and under either list key."""
+    import wingmanem.app as app
+    fenced = '```json\n{"reports": [{"first_name": "A"}, 3]}\n```'
+    assert app._parse_mistral_json_objects(fenced, ("reports", "direct_reports")) == [{"first_name": "A"}]
+    assert app._parse_mistral_json_objects('{"x": [{"a": 1}]}', ("reports",)) == [{"a": 1}]
+    assert app._parse_mistral_json_objects("not json", ("reports",)) == []
+
+
 def test_compute_milestones_empty():
     """Compute milestones from empty reports returns empty list."""
     import wingmanem.app as app
@@ -112,6 +324,32 @@ def test_compute_milestones_empty():
     assert out == []
 
 
+def test_parse_milestone_dates_accepts_what_strptime_did():
+    """Stored dates parse exactly as strptime("%Y-%m-%d") did: unpadded yes, compact/ISO-week/invalid no."""
+    import wingmanem.app as app
+    cases = {"1990-3-5": (1990, 3, 5), "1990-03-05": (1990, 3, 5), "2000-02-29": (2000, 2, 29),
+             "19900305": None, "1990-W10-1": None, "1990-02-30": None, "1990-3-5\n": None, "": None}
+    for raw, expected in cases.items():
+        assert app._parse_milestone_dates([{"first_name": "A", "last_name": "B", "birthday": raw}])[0][1] == expected
+    assert app._parse_milestone_dates([{"birthday": 19900305}])[0][1] is None
+
+
+def test_parse_optional_date_accepts_separator_and_strptime_forms():
+    """Dashes/spaces anywhere around 8 digits, unpadded or space-padded month/day parse; others re-prompt."""
+    from datetime import date
+
+    import wingmanem.app as app
+    for raw in ("1990-05-15", "19900515", "1990 05 15", "1990 - 05 - 15", "19-90-05-15", "1990-5-15", "1990-5- 5"):
+        expected = date(1990, 5, 5) if raw.endswith(" 5") else date(1990, 5, 15)
+        with patch("builtins.input", return_value=raw):
+            assert app._parse_optional_date("> ") == expected
+    with patch("builtins.input", side_effect=["1990-02-30", "1990/05/15", ""]), patch(
+        "sys.stdout", new_callable=StringIO
+    ) as out:
+        assert app._parse_optional_date("> ") is None
+    assert out.getvalue().count("Invalid date") == 2
+
+
 def test_prompt_direct_report_id_no_reports():
     """Prompt for direct report ID with no reports returns None."""
     import wingmanem.app as app
@@ -188,6 +426,14 @@ def test_one_to_one_menu_back():
     assert result is True
 
 
+def test_prompt_choice_rejects_non_digits_and_out_of_range():
+    """_prompt_choice returns the option for 1..max (surrounding spaces ok), else 0."""
+    import wingmanem.app as app
+    for raw, expected in (("2", 2), (" 4 ", 4), ("0", 0), ("5", 0), ("", 0), ("x", 0), ("-1", 0), ("²", 0)):
+        with patch("builtins.input", return_value=raw):
+            assert app._prompt_choice("> ", 4) == expected
+
+
 def test_run_main_menu_exit():
     """Main menu: select Exit (3) returns False."""
     import wingmanem.app as app
@@ -196,6 +442,18 @@ def test_run_main_menu_exit():
     assert result is False
 
 
+def test_run_main_menu_invalid_choice_reprompts_without_redraw():
+    """Main menu: invalid choices (0, hidden 4–8) re-prompt in place; no pause, one clear."""
+    import wingmanem.app as app
+    with patch("wingmanem.app._clear_screen") as clear, patch("wingmanem.app._prompt_choice", side_effect=[0, 5, 3]), \
+         patch("wingmanem.app._pause") as pause, patch("sys.stdout", new_callable=StringIO) as out:
+        result = app.run_main_menu()
+    assert result is False
+    assert clear.call_count == 1
+    pause.assert_not_called()
+    assert out.getvalue().count("Invalid option.") == 2
+
+
 def test_run_main_menu_people_then_back_then_exit():
     """Main -> People (2) -> Back (7) from submenu -> back at main -> Exit (3)."""
     import wingmanem.app as app
@@ -232,6 +490,54 @@ def test_people_menu_milestone_reminders_then_back():
     assert True
 
 
+def test_milestone_reminders_load_once_and_filter_by_range():
+    """Wider ranges reuse the first computation; output matches _compute_milestones_from_reports."""
+    from datetime import date, timedelta
+    import wingmanem.app as app
+    soon = date.today() + timedelta(days=10)
+    later = date.today() + timedelta(days=100)
+    reports = [
+        {"first_name": "Ann", "last_name": "Lee", "birthday": soon.replace(year=1990).isoformat(), "hire_date": None},
+        {"first_name": "Bo", "last_name": "Kim", "birthday": None, "hire_date": later.replace(year=2020).isoformat()},
+    ]
+    out = StringIO()
+    with patch("wingmanem.app._clear_screen"), patch("wingmanem.app._db_load_direct_reports", return_value=reports) as load, \
+         patch("builtins.input", side_effect=["120", ""]), patch("sys.stdout", out):
+        assert app._view_milestone_reminders() is True
+    assert load.call_count == 1
+    text = out.getvalue()
+    first, second = text.split("Showing the next 120 days.")
+    assert "Birthday: Ann Lee" in first and "Anniversary: Bo Kim" not in first
+    for _, msg in app._compute_milestones_from_reports(reports, 120):
+        assert msg in second
+
+
+def test_clear_screen_windows_falls_back_to_cls_when_vt_unavailable():
+    """On Windows, VT mode is tried once; if refused, every clear uses cls and no escapes are written."""
+    import wingmanem.app as app
+    for vt_ok in (False, True):
+        out = StringIO()
+        out.isatty = lambda: True
+        with patch.object(app, "_windows_vt_enabled", None), patch("os.name", "nt"), patch(
+            "wingmanem.app._enable_windows_vt_mode", return_value=vt_ok
+        ) as enable, patch("os.system") as system, patch("sys.stdout", out), patch.dict(os.environ, {"TERM": "xterm"}):
+            app._clear_screen()
+            app._clear_screen()
+        assert enable.call_count == 1
+        assert system.call_count == (0 if vt_ok else 2)
+        assert out.getvalue() == (app._CLEAR_SCREEN_SEQ * 2 if vt_ok else "")
+
+
+def test_run_submenu_invalid_choice_reprompts_without_redraw():
+    """An invalid choice re-prompts under the menu on screen: no clear, no repaint, no pause."""
+    import wingmanem.app as app
+    with patch("wingmanem.app._clear_screen") as clear, patch("wingmanem.app._prompt_choice", side_effect=[0, 0, 2]), \
+         patch("wingmanem.app._pause") as pause, patch("sys.stdout", new_callable=StringIO):
+        app._run_submenu("MENU", 2, {})
+    assert clear.call_count == 1
+    pause.assert_not_called()
+
+
 def test_one_to_one_menu_view_then_back():
     """People -> 1 (1:1) -> 2 (View responses) -> 5 (Back) -> 7 (Back to main)."""
     import wingmanem.app as app
@@ -240,6 +546,17 @@ def test_one_to_one_menu_view_then_back():
     assert True
 
 
+def test_authenticate_accepts_only_exact_password():
+    """authenticate() matches the exact password; prefixes, extensions and EOF are rejected."""
+    import wingmanem.app as app
+    with patch("wingmanem.app._get_expected_password", return_value="s3cret"):
+        for attempt, ok in (("s3cret", True), ("s3cre", False), ("s3cret!", False), ("", False)):
+            with patch("getpass.getpass", return_value=attempt):
+                assert app.authenticate() is ok
+        with patch("getpass.getpass", side_effect=EOFError):
+            assert app.authenticate() is False
+
+
 if __name__ == "__main__":
     # Run with: python tests/test_app_enabled.py
     import pytest
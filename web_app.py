@@ -616,7 +616,7 @@ def one_to_one_upload():
             try:
                 import httpx
 
-                client = app_module.Mistral(api_key=app_module._get_mistral_api_key())
+                client = app_module._get_mistral_client(app_module._get_mistral_api_key())
                 with open(path, "rb") as fp:
                     trans = client.audio.transcriptions.complete(
                         model="voxtral-mini-latest",
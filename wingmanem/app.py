@@ -17,18 +17,23 @@ Sections (in order):
  10. Entry point (main)
 """
 
-import getpass
+import atexit
+import bisect
+import functools
 import json
+import operator
 import os
 import random
+import re
 import sys
 from collections.abc import Callable
-from datetime import date, datetime
+from datetime import date
 from typing import Any
 
-Mistral = None  # type: ignore[misc, assignment]
-MISTRAL_AVAILABLE = False
-MISTRAL_IMPORT_ERROR: str | None = None
+# Mistral SDK globals — ``Mistral`` (client class or None), ``MISTRAL_AVAILABLE`` (bool) and
+# ``MISTRAL_IMPORT_ERROR`` (str | None) — are set by _load_mistral_sdk on first use, not at import:
+# mistralai pulls in httpx/pydantic, which browsing the CLI menus never needs.
+_MISTRAL_SDK_NAMES = frozenset({"Mistral", "MISTRAL_AVAILABLE", "MISTRAL_IMPORT_ERROR"})
 
 
 def _load_mistral_sdk() -> None:
@@ -65,7 +70,46 @@ def _load_mistral_sdk() -> None:
     MISTRAL_IMPORT_ERROR = "; ".join(errs) if errs else "unknown error loading mistralai"
 
 
-_load_mistral_sdk()
+def _ensure_mistral_sdk() -> bool:
+    """Import the Mistral SDK on first call (see _load_mistral_sdk); return MISTRAL_AVAILABLE."""
+    if "MISTRAL_AVAILABLE" not in globals():
+        _load_mistral_sdk()
+    return MISTRAL_AVAILABLE
+
+
+# Former module-level menu constants -> the builders that replaced them (cached, except the
+# direct reports menu, which follows Mistral SDK availability)
+_LAZY_MENU_BUILDERS = {
+    "DEVELOPER_MENU": "_developer_menu",
+    "PROJECT_MENU": "_project_menu",
+    "ONE_TO_ONE_MENU": "_one_to_one_menu",
+    "PEOPLE_MENU": "_people_menu",
+    "DIRECT_REPORTS_MENU": "_direct_reports_menu",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazy Mistral SDK globals and menu strings for ``wingmanem.app.<name>`` access (e.g. from web_app)."""
+    if name in _MISTRAL_SDK_NAMES:
+        _ensure_mistral_sdk()
+        return globals()[name]
+    if name in _LAZY_MENU_BUILDERS:
+        return globals()[_LAZY_MENU_BUILDERS[name]]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+try:  # Optional: faster JSON for data files and Mistral replies; stdlib json otherwise
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """json.loads via orjson when installed (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
 
 from wingmanem.constants import (
     DATABASE_PATH,
@@ -75,6 +119,8 @@ from wingmanem.constants import (
     DIRECT_REPORTS_FILE,
     EMPLOYEE_COMP_DATA_FILE,
     LEGACY_DIRECT_REPORT_COMP_DATA_FILE,
+    LEGACY_DIRECT_REPORTS_FILE,
+    LEGACY_MANAGEMENT_TIPS_FILE,
     MANAGEMENT_TIPS_FILE,
     MENU_BOLD,
     MENU_COLOR_BLACK,
@@ -92,6 +138,12 @@ from wingmanem.settings import cli_expected_password, mistral_api_key
 direct_reports: list[dict[str, Any]] = []
 # Each item: {"date": "YYYY-MM-DD", "text": "tip content"}
 management_tips: list[dict[str, str]] = []
+# Next id handed out by _next_direct_report_id (0 = seed from direct_reports on first use)
+_direct_report_id_counter: int = 0
+# Lines in the direct reports journal (DIRECT_REPORTS_FILE) since it was last compacted
+_direct_reports_journal_lines: int = 0
+# Compact the journal once it holds this many lines per live report
+_DIRECT_REPORTS_JOURNAL_COMPACT_RATIO = 4
 
 
 # ============================================================================
@@ -101,35 +153,202 @@ management_tips: list[dict[str, str]] = []
 _db_available: bool = True  # Set False if DB file missing or init fails; app runs without DB.
 
 
+def _read_json_file(path: str) -> Any:
+    """Parse a JSON file from its raw bytes (no text decode layer); an empty file yields []."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return _json_loads(data) if data else []
+
+
+_CODE_FENCE_RE = re.compile(r"\A```[^\n]*\n|\n?```\s*\Z")
+
+
+def _parse_mistral_json_objects(raw: str, list_keys: tuple[str, ...]) -> list[dict]:
+    """Parse a Mistral JSON reply into a list of objects.
+    Strips a markdown code fence if present, then accepts a bare array or an object holding the
+    array under one of list_keys (else the first list-of-objects value). Returns [] if unparseable."""
+    response_text = _CODE_FENCE_RE.sub("", raw.strip()).strip()
+    try:
+        parsed = _json_loads(response_text)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if isinstance(parsed, list):
+        return [x for x in parsed if isinstance(x, dict)]
+    if not isinstance(parsed, dict):
+        return []
+    for key in list_keys:
+        arr = parsed.get(key)
+        if arr:
+            if isinstance(arr, list):
+                objects = [x for x in arr if isinstance(x, dict)]
+                if objects:
+                    return objects
+            break
+    for v in parsed.values():
+        if isinstance(v, list) and v and isinstance(v[0], dict):
+            return [x for x in v if isinstance(x, dict)]
+    return []
+
+
+def _json_line(obj: Any) -> str:
+    """Compact one-line JSON (UTF-8 text, no ASCII escaping) for NDJSON files."""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _persisted_direct_report(r: dict[str, Any]) -> dict[str, Any]:
+    """Copy of a report without in-memory cache keys (leading underscore)."""
+    return {k: v for k, v in r.items() if not k.startswith("_")}
+
+
+def _read_direct_reports_file(path: str) -> list[dict[str, Any]]:
+    """Replay the direct reports journal: one {"op": "add", "rec": {...}} or {"op": "del", "id": n}
+    per line. A legacy JSON array file is also accepted. Undecodable lines are skipped.
+    The journal is streamed line by line, so peak memory is the records plus one line, not the file."""
+    reports: list[dict[str, Any]] = []
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(b"[") and not reports:
+                break  # legacy JSON array (read whole below)
+            try:
+                entry = _json_loads(line)
+            except ValueError:  # JSONDecodeError, or UnicodeDecodeError on a torn multibyte character
+                continue
+            if not isinstance(entry, dict):
+                continue
+            op = entry.get("op")
+            if op == "add" and isinstance(entry.get("rec"), dict):
+                reports.append(entry["rec"])
+            elif op == "del":
+                target_id = entry.get("id")
+                for i, r in enumerate(reports):
+                    if r.get("id") == target_id:
+                        del reports[i]
+                        break
+        else:
+            return reports
+    parsed = _read_json_file(path)
+    return [r for r in parsed if isinstance(r, dict)] if isinstance(parsed, list) else []
+
+
 def _write_direct_reports_json_file(reports: list[dict[str, Any]]) -> None:
-    """Persist direct reports list to JSON (mirror of DB; same shape as historical file)."""
+    """Rewrite the direct reports journal as one add line per report (mirror of DB; compaction).
+    In-memory cache keys (leading underscore) are dropped. Written to a temp file, fsynced, and swapped in
+    with os.replace, so a crash or power loss mid-write leaves the previous journal intact. Rewrites are
+    rare (load, compaction, purge); appends are fsynced once at exit (see atexit)."""
+    global _direct_reports_journal_lines
+    tmp = DIRECT_REPORTS_FILE + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(_json_line({"op": "add", "rec": _persisted_direct_report(r)}) + "\n" for r in reports)
+            # Data must reach disk before the rename does, or a power loss can leave a short journal
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, DIRECT_REPORTS_FILE)
+        _direct_reports_journal_lines = len(reports)
+    except OSError as e:
+        print(f"Could not write {DIRECT_REPORTS_FILE}: {e}", file=sys.stderr)
+
+
+@atexit.register
+def _fsync_direct_reports_file() -> None:
+    """Flush the direct reports journal to disk once at exit instead of fsyncing every save."""
+    if not os.path.isfile(DIRECT_REPORTS_FILE):
+        return
+    try:
+        fd = os.open(DIRECT_REPORTS_FILE, os.O_RDWR)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _append_direct_report_ops(ops: list[dict[str, Any]], reports: list[dict[str, Any]]) -> None:
+    """Append add/del ops to the journal; compact it from reports (the resulting list) once it
+    exceeds _DIRECT_REPORTS_JOURNAL_COMPACT_RATIO lines per live report."""
+    global _direct_reports_journal_lines
+    if _direct_reports_journal_lines + len(ops) > _DIRECT_REPORTS_JOURNAL_COMPACT_RATIO * max(len(reports), 1):
+        _write_direct_reports_json_file(reports)
+        return
     try:
-        with open(DIRECT_REPORTS_FILE, "w", encoding="utf-8") as f:
-            json.dump(reports, f, indent=2)
+        with open(DIRECT_REPORTS_FILE, "a", encoding="utf-8") as f:
+            f.writelines(_json_line(op) + "\n" for op in ops)
+        _direct_reports_journal_lines += len(ops)
     except OSError as e:
         print(f"Could not write {DIRECT_REPORTS_FILE}: {e}", file=sys.stderr)
 
 
+def _direct_report_add_op(r: dict[str, Any]) -> dict[str, Any]:
+    """Journal entry recording that report r was added."""
+    return {"op": "add", "rec": _persisted_direct_report(r)}
+
+
+def _read_management_tips_file(path: str) -> list[Any]:
+    """Parse the tips file: NDJSON (one entry per line). A legacy JSON array file is also accepted.
+    Undecodable lines (e.g. a torn final append, even one cut inside a UTF-8 character) are skipped
+    so earlier tips survive."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.lstrip().startswith(b"["):
+        parsed = _json_loads(data)
+        return parsed if isinstance(parsed, list) else []
+    out: list[Any] = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            out.append(_json_loads(line))
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError on a torn multibyte character
+            continue
+    return out
+
+
 def _write_management_tips_json_file(tips: list[dict[str, str]]) -> None:
+    """Rewrite the whole tips file as NDJSON (load mirror / migration; new tips use _append_management_tip).
+    Written to a temp file, fsynced, and swapped in with os.replace (as the direct reports journal is), so a
+    failed write leaves the previous file, or no file at all, rather than a partial one."""
+    tmp = MANAGEMENT_TIPS_FILE + ".tmp"
     try:
-        with open(MANAGEMENT_TIPS_FILE, "w", encoding="utf-8") as f:
-            json.dump(tips, f, indent=2)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(_json_line(t) + "\n" for t in tips)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, MANAGEMENT_TIPS_FILE)
+    except OSError as e:
+        print(f"Could not write {MANAGEMENT_TIPS_FILE}: {e}", file=sys.stderr)
+
+
+def _append_management_tip(entry: dict[str, Any]) -> None:
+    """Append one tip line to the NDJSON tips file without rewriting earlier entries."""
+    try:
+        with open(MANAGEMENT_TIPS_FILE, "a", encoding="utf-8") as f:
+            f.write(_json_line(entry) + "\n")
     except OSError as e:
         print(f"Could not write {MANAGEMENT_TIPS_FILE}: {e}", file=sys.stderr)
 
 
 def _write_direct_report_goals_json_file(goals: list[dict[str, Any]]) -> None:
+    # Serialize first: one write, and an unserializable value no longer leaves a truncated file
+    payload = json.dumps(goals, indent=2)
     try:
         with open(DIRECT_REPORT_GOALS_FILE, "w", encoding="utf-8") as f:
-            json.dump(goals, f, indent=2)
+            f.write(payload)
     except OSError as e:
         print(f"Could not write {DIRECT_REPORT_GOALS_FILE}: {e}", file=sys.stderr)
 
 
 def _write_direct_report_comp_data_json_file(records: list[dict[str, Any]]) -> None:
+    # Serialize first: one write, and an unserializable value no longer leaves a truncated file
+    payload = json.dumps(records, indent=2)
     try:
         with open(DIRECT_REPORT_COMP_DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(records, f, indent=2)
+            f.write(payload)
     except OSError as e:
         print(f"Could not write {DIRECT_REPORT_COMP_DATA_FILE}: {e}", file=sys.stderr)
 
@@ -148,6 +367,30 @@ def _db_init() -> None:
         print(f"Database unavailable (will run without DB): {e}", file=sys.stderr)
 
 
+def _direct_report_orm(r: dict[str, Any]) -> Any:
+    """Build a DirectReportORM row from a direct report dict."""
+    from wingmanem.orm_models import DirectReportORM
+
+    oid = r.get("owner_user_id")
+    return DirectReportORM(
+        id=int(r.get("id") or 0),
+        first_name=r.get("first_name") or "",
+        last_name=r.get("last_name") or "",
+        street_address_1=r.get("street_address_1"),
+        street_address_2=r.get("street_address_2"),
+        city=r.get("city"),
+        state=r.get("state"),
+        zipcode=r.get("zipcode"),
+        country=r.get("country"),
+        birthday=r.get("birthday"),
+        hire_date=r.get("hire_date"),
+        current_role=r.get("current_role"),
+        role_start_date=r.get("role_start_date"),
+        partner_name=r.get("partner_name"),
+        owner_user_id=int(oid) if oid is not None else None,
+    )
+
+
 def _db_replace_direct_reports_from_list(reports: list[dict[str, Any]]) -> None:
     """Replace direct_reports table with the given list (same scope as rewriting direct_reports.json)."""
     if not _db_available:
@@ -160,27 +403,32 @@ def _db_replace_direct_reports_from_list(reports: list[dict[str, Any]]) -> None:
     session = get_session()
     try:
         session.execute(delete(DirectReportORM))
-        for r in reports:
-            oid = r.get("owner_user_id")
-            session.add(
-                DirectReportORM(
-                    id=int(r.get("id") or 0),
-                    first_name=r.get("first_name") or "",
-                    last_name=r.get("last_name") or "",
-                    street_address_1=r.get("street_address_1"),
-                    street_address_2=r.get("street_address_2"),
-                    city=r.get("city"),
-                    state=r.get("state"),
-                    zipcode=r.get("zipcode"),
-                    country=r.get("country"),
-                    birthday=r.get("birthday"),
-                    hire_date=r.get("hire_date"),
-                    current_role=r.get("current_role"),
-                    role_start_date=r.get("role_start_date"),
-                    partner_name=r.get("partner_name"),
-                    owner_user_id=int(oid) if oid is not None else None,
-                )
-            )
+        session.add_all([_direct_report_orm(r) for r in reports])
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _db_apply_direct_report_ops(ops: list[dict[str, Any]]) -> None:
+    """Apply direct report journal entries (add/del, see _save_direct_reports) in one transaction,
+    touching only the affected rows instead of replacing the table."""
+    if not _db_available:
+        return
+    from sqlalchemy import delete
+
+    from wingmanem.database import get_session
+    from wingmanem.orm_models import DirectReportORM
+
+    session = get_session()
+    try:
+        for op in ops:
+            if op["op"] == "add":
+                session.add(_direct_report_orm(op["rec"]))
+            elif op["op"] == "del":
+                session.execute(delete(DirectReportORM).where(DirectReportORM.id == op["id"]))
         session.commit()
     except Exception:
         session.rollback()
@@ -190,7 +438,7 @@ def _db_replace_direct_reports_from_list(reports: list[dict[str, Any]]) -> None:
 
 
 def _db_replace_management_tips_from_list(tips: list[dict[str, str]]) -> None:
-    """Replace management_tips table with the given list (same scope as rewriting management_tips.json)."""
+    """Replace management_tips table with the given list (same scope as rewriting the tips file)."""
     if not _db_available:
         return
     from sqlalchemy import delete
@@ -507,7 +755,7 @@ def _ensure_daily_management_tip_for_user(owner_user_id: int) -> None:
     today_str = date.today().isoformat()
     if _user_has_management_tip_for_date(owner_user_id, today_str):
         return
-    if not MISTRAL_AVAILABLE or not _get_mistral_api_key():
+    if not _get_mistral_api_key() or not _ensure_mistral_sdk():
         return
     _generate_management_tip_with_ai(silent=True, owner_user_id=owner_user_id)
 
@@ -540,17 +788,52 @@ def _migrate_direct_report_comp_json_file() -> None:
             pass
 
 
+def _migrate_management_tips_json_file() -> None:
+    """Rewrite the legacy JSON-array tips file as the NDJSON tips file if needed."""
+    legacy = LEGACY_MANAGEMENT_TIPS_FILE
+    current = MANAGEMENT_TIPS_FILE
+    if legacy == current or not os.path.isfile(legacy) or os.path.isfile(current):
+        return
+    try:
+        tips = _read_management_tips_file(legacy)
+    except (ValueError, OSError):
+        return
+    _write_management_tips_json_file([t for t in tips if isinstance(t, (dict, str))])
+    if os.path.isfile(current):  # only ever a complete file: the writer swaps it in with os.replace
+        try:
+            os.remove(legacy)
+        except OSError:
+            pass
+
+
+def _migrate_direct_reports_json_file() -> None:
+    """Rewrite the legacy JSON-array direct reports file as the journal file if needed."""
+    legacy = LEGACY_DIRECT_REPORTS_FILE
+    current = DIRECT_REPORTS_FILE
+    if legacy == current or not os.path.isfile(legacy) or os.path.isfile(current):
+        return
+    try:
+        reports = _read_direct_reports_file(legacy)
+    except (ValueError, OSError):
+        return
+    _write_direct_reports_json_file(reports)
+    if os.path.isfile(current):
+        try:
+            os.remove(legacy)
+        except OSError:
+            pass
+
+
 def _db_populate_from_json_files() -> None:
     """Seed SQLite from JSON only when the corresponding table is empty (migration / first run)."""
     if not _db_available:
         return
     _migrate_direct_report_comp_json_file()
+    _migrate_management_tips_json_file()
+    _migrate_direct_reports_json_file()
     if not _db_load_direct_reports() and os.path.isfile(DIRECT_REPORTS_FILE):
         try:
-            with open(DIRECT_REPORTS_FILE, encoding="utf-8") as f:
-                data = json.load(f)
-            raw = data if isinstance(data, list) else []
-            reports = [_normalize_direct_report(r) for r in raw if isinstance(r, dict)]
+            reports = [_normalize_direct_report(r) for r in _read_direct_reports_file(DIRECT_REPORTS_FILE)]
             seed_owner = _db_first_user_id()
             if seed_owner is not None:
                 for r in reports:
@@ -558,12 +841,11 @@ def _db_populate_from_json_files() -> None:
                         r["owner_user_id"] = seed_owner
             if reports:
                 _db_replace_direct_reports_from_list(reports)
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             pass
     if not _db_load_management_tips() and os.path.isfile(MANAGEMENT_TIPS_FILE):
         try:
-            with open(MANAGEMENT_TIPS_FILE, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_management_tips_file(MANAGEMENT_TIPS_FILE)
             tips: list[dict[str, str]] = []
             if isinstance(data, list):
                 for item in data:
@@ -578,12 +860,11 @@ def _db_populate_from_json_files() -> None:
                         t["owner_user_id"] = tip_owner
             if tips:
                 _db_replace_management_tips_from_list(tips)
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             pass
     if not _db_load_all_goals() and os.path.isfile(DIRECT_REPORT_GOALS_FILE):
         try:
-            with open(DIRECT_REPORT_GOALS_FILE, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json_file(DIRECT_REPORT_GOALS_FILE)
             raw = data if isinstance(data, list) else []
             goals: list[dict[str, Any]] = []
             for g in raw:
@@ -606,8 +887,7 @@ def _db_populate_from_json_files() -> None:
     )
     if not _db_load_direct_report_comp_data() and os.path.isfile(comp_json):
         try:
-            with open(comp_json, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json_file(comp_json)
             if isinstance(data, list) and data:
                 _db_replace_direct_report_comp_data_from_list(data)
         except (json.JSONDecodeError, OSError):
@@ -1080,8 +1360,7 @@ def _load_direct_report_goals() -> list[dict[str, Any]]:
         _save_direct_report_goals(goals)
         return goals
     try:
-        with open(DIRECT_REPORT_GOALS_FILE, encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json_file(DIRECT_REPORT_GOALS_FILE)
         raw = data if isinstance(data, list) else []
         goals = []
         for g in raw:
@@ -1177,7 +1456,7 @@ def _delete_all_goals() -> None:
 
 def _generate_goals_with_ai(num: int) -> int:
     """Generate goals for direct reports using Mistral AI. Returns count of goals added."""
-    if not MISTRAL_AVAILABLE:
+    if not _ensure_mistral_sdk():
         return 0
     api_key = _get_mistral_api_key()
     if not api_key:
@@ -1211,7 +1490,7 @@ Distribute goals across different direct reports. Example:
 Output only this JSON object, no other text."""
 
     try:
-        client = Mistral(api_key=api_key)
+        client = _get_mistral_client(api_key)
         valid_ids = {r["id"] for r in report_list}
         try:
             message = client.chat.complete(
@@ -1232,30 +1511,7 @@ Output only this JSON object, no other text."""
             )
         else:
             raw = raw or ""
-        response_text = raw.strip()
-        if response_text.startswith("```"):
-            end = response_text.find("\n", 3)
-            if end != -1:
-                response_text = response_text[end + 1 :].rstrip()
-            if response_text.endswith("```"):
-                response_text = response_text[:-3].rstrip()
-
-        objects: list[dict] = []
-        try:
-            parsed = json.loads(response_text)
-            if isinstance(parsed, dict):
-                arr = parsed.get("goals") or parsed.get("goals_list")
-                if isinstance(arr, list):
-                    objects = [x for x in arr if isinstance(x, dict)]
-                if not objects:
-                    for v in parsed.values():
-                        if isinstance(v, list) and v and isinstance(v[0], dict):
-                            objects = [x for x in v if isinstance(x, dict)]
-                            break
-            elif isinstance(parsed, list):
-                objects = [x for x in parsed if isinstance(x, dict)]
-        except (json.JSONDecodeError, TypeError):
-            pass
+        objects = _parse_mistral_json_objects(raw, ("goals", "goals_list"))
 
         goals = _load_direct_report_goals()
         next_id = _next_goal_id(goals)
@@ -1285,7 +1541,7 @@ Output only this JSON object, no other text."""
 
 def _generate_goals_with_ai_for_user(owner_user_id: int, num: int) -> int:
     """Like _generate_goals_with_ai but only for direct reports owned by owner_user_id."""
-    if not MISTRAL_AVAILABLE:
+    if not _ensure_mistral_sdk():
         return 0
     api_key = _get_mistral_api_key()
     if not api_key:
@@ -1320,7 +1576,7 @@ Distribute goals across different direct reports. Example:
 Output only this JSON object, no other text."""
 
     try:
-        client = Mistral(api_key=api_key)
+        client = _get_mistral_client(api_key)
         valid_ids = {r["id"] for r in report_list}
         try:
             message = client.chat.complete(
@@ -1341,30 +1597,7 @@ Output only this JSON object, no other text."""
             )
         else:
             raw = raw or ""
-        response_text = raw.strip()
-        if response_text.startswith("```"):
-            end = response_text.find("\n", 3)
-            if end != -1:
-                response_text = response_text[end + 1 :].rstrip()
-            if response_text.endswith("```"):
-                response_text = response_text[:-3].rstrip()
-
-        objects: list[dict] = []
-        try:
-            parsed = json.loads(response_text)
-            if isinstance(parsed, dict):
-                arr = parsed.get("goals") or parsed.get("goals_list")
-                if isinstance(arr, list):
-                    objects = [x for x in arr if isinstance(x, dict)]
-                if not objects:
-                    for v in parsed.values():
-                        if isinstance(v, list) and v and isinstance(v[0], dict):
-                            objects = [x for x in v if isinstance(x, dict)]
-                            break
-            elif isinstance(parsed, list):
-                objects = [x for x in parsed if isinstance(x, dict)]
-        except (json.JSONDecodeError, TypeError):
-            pass
+        objects = _parse_mistral_json_objects(raw, ("goals", "goals_list"))
 
         goals = _load_direct_report_goals_for_user(owner_user_id)
         next_id = _next_goal_id_global()
@@ -1545,15 +1778,35 @@ _db_sync_direct_report_comp_data_from_list = _db_replace_direct_report_comp_data
 # UTILITIES — config, I/O, menu building
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def _get_expected_password() -> str:
-    """Expected password for optional CLI ``authenticate()`` (``WINGMANEM_PASSWORD``)."""
+    """Expected password for optional CLI ``authenticate()`` (``WINGMANEM_PASSWORD``).
+    Read once per process (.env is loaded when settings is imported); cache_clear() re-reads it."""
     return cli_expected_password()
 
 
+@functools.lru_cache(maxsize=1)
 def _get_mistral_api_key() -> str | None:
+    """``MISTRAL_API_KEY``, read once per process like _get_expected_password (cache_clear() re-reads it)."""
     return mistral_api_key()
 
 
+_mistral_client: Any = None
+_mistral_client_key: tuple[Any, str] | None = None  # (client class, api key) the cached client was built for
+
+
+def _get_mistral_client(api_key: str) -> Any:
+    """Return a shared Mistral client (built on first use; rebuilt only if the key or SDK class changes).
+    Reusing one client keeps its HTTP connection pool warm across tip, report, goal and 1:1 calls."""
+    global _mistral_client, _mistral_client_key
+    _ensure_mistral_sdk()
+    key = (Mistral, api_key)
+    if _mistral_client is None or _mistral_client_key != key:
+        _mistral_client = Mistral(api_key=api_key)
+        _mistral_client_key = key
+    return _mistral_client
+
+
 def mistral_api_configured() -> bool:
     """True when ``MISTRAL_API_KEY`` is set — the web UI may offer Mistral actions."""
     return bool(_get_mistral_api_key())
@@ -1561,11 +1814,12 @@ def mistral_api_configured() -> bool:
 
 def mistral_client_usable() -> bool:
     """True when the ``mistralai`` package is importable and an API key is set."""
-    return bool(MISTRAL_AVAILABLE and mistral_api_configured())
+    return bool(mistral_api_configured() and _ensure_mistral_sdk())
 
 
 def mistral_sdk_unavailable_message() -> str:
     """Explain why the Mistral SDK is not usable (for Flask flash / logs)."""
+    _ensure_mistral_sdk()
     detail = MISTRAL_IMPORT_ERROR or "no import exception was recorded (try pip install mistralai in this venv)."
     return (
         "The Mistral AI client could not be loaded in this Python environment. "
@@ -1574,21 +1828,58 @@ def mistral_sdk_unavailable_message() -> str:
     )
 
 
+_CLEAR_SCREEN_SEQ = "\x1b[2J\x1b[3J\x1b[H"  # erase display and scrollback (as clear does), cursor home
+# Windows console ANSI support: None = not tried yet, else whether SetConsoleMode enabled it
+_windows_vt_enabled: bool | None = None
+
+
+def _enable_windows_vt_mode() -> bool:
+    """Turn on ANSI (virtual terminal) processing for the Windows console's stdout. True on success."""
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        return False
+
+
 def _clear_screen() -> None:
-    """Clear terminal for cleaner menu display."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """Clear terminal for cleaner menu display (ANSI escape; no clear subprocess per menu).
+    No-op when stdout is not a terminal (or TERM=dumb), so piped or redirected output and
+    terminals without ANSI support stay free of escapes."""
+    global _windows_vt_enabled
+    if not sys.stdout.isatty() or os.environ.get("TERM") == "dumb":
+        return
+    if os.name == "nt":
+        if _windows_vt_enabled is None:
+            _windows_vt_enabled = _enable_windows_vt_mode()
+        if not _windows_vt_enabled:
+            # Console cannot interpret escapes: clear with cls every time
+            os.system("cls")
+            return
+    # No flush: the screen that follows is written (and flushed) right after, or input() flushes
+    sys.stdout.write(_CLEAR_SCREEN_SEQ)
+
+
+def _emit(lines: list[str]) -> None:
+    """Write a whole screen of lines with one write and one flush (instead of a flush per print)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def _prompt_choice(prompt: str, max_option: int) -> int:
-    """Prompt for numeric choice; returns 1-based option or 0 on invalid."""
-    try:
-        raw = input(prompt).strip()
-        choice = int(raw)
-        if 1 <= choice <= max_option:
-            return choice
-    except ValueError:
-        pass
-    return 0
+    """Prompt for numeric choice; returns 1-based option or 0 on invalid.
+    Anything but decimal digits is rejected by isdecimal() up front rather than by catching int()'s ValueError."""
+    raw = input(prompt).strip()
+    if not raw.isdecimal():
+        return 0
+    choice = int(raw)
+    return choice if 1 <= choice <= max_option else 0
 
 
 def _pause() -> None:
@@ -1597,25 +1888,39 @@ def _pause() -> None:
 
 
 def _wrap_text(text: str, width: int) -> list[str]:
-    """Wrap text to fit within width, breaking at word boundaries. Returns list of lines."""
+    """Wrap text to fit within width, breaking at word boundaries. Returns list of lines.
+    Runs of whitespace collapse to one space; a word longer than width is truncated on its own line.
+    Greedy by estimate: jump width characters ahead in the collapsed paragraph and back off to the
+    last space (rfind), so the work is per line rather than per word."""
     if not text.strip():
         return [""]
+    if len(text) <= width and "\n" not in text:
+        # Fits on one line already: only the whitespace collapse applies
+        return [" ".join(text.split())]
     lines: list[str] = []
     for paragraph in text.split("\n"):
-        words = paragraph.split()
-        current: list[str] = []
-        current_len = 0
-        for w in words:
-            if current_len + len(current) + len(w) <= width:
-                current.append(w)
-                current_len += len(w)
+        paragraph = " ".join(paragraph.split())
+        end = len(paragraph)
+        i = 0  # start of the next line (always a word start)
+        while i < end:
+            j = i + width
+            if j >= end:
+                lines.append(paragraph[i:])
+                break
+            if paragraph[j] == " ":
+                # A word ends exactly at the width
+                lines.append(paragraph[i:j])
+                i = j + 1
+                continue
+            k = paragraph.rfind(" ", i, j)
+            if k >= 0:
+                lines.append(paragraph[i:k])
+                i = k + 1
             else:
-                if current:
-                    lines.append(" ".join(current))
-                current = [w] if len(w) <= width else [w[:width]]
-                current_len = len(current[0]) if len(w) > width else len(w)
-        if current:
-            lines.append(" ".join(current))
+                # Single word longer than width: truncate it and move past it
+                lines.append(paragraph[i:j])
+                k = paragraph.find(" ", j)
+                i = end if k < 0 else k + 1
     return lines
 
 
@@ -1630,12 +1935,27 @@ def _menu_box(
     Default font is black; set red=True for red font. If middle is provided, those lines
     appear inside the box. A middle item can be a string (entire line bold) or
     (bold_prefix, rest) so only the bold_prefix is bold.
-    middle_position can be 'top' (default) or 'bottom'."""
-    border = "╔" + "═" * width + "╗"
-    sep = "╠" + "═" * width + "╣"
-    bottom = "╚" + "═" * width + "╝"
-    title_content = title[:width].ljust(width)
-    lines = ["║" + MENU_BOLD + title_content + MENU_COLOR_RESET + "║"]
+    middle_position can be 'top' (default) or 'bottom'.
+    Rendering is memoized per arguments (see _menu_box_cached)."""
+    return _menu_box_cached(title, tuple(options), width, tuple(middle) if middle else (), middle_position)
+
+
+@functools.lru_cache(maxsize=64)
+def _menu_box_cached(
+    title: str,
+    options: tuple[str | tuple[str, bool] | tuple[str, bool, bool], ...],
+    width: int,
+    middle: tuple[str | tuple[str, str], ...],
+    middle_position: str,
+) -> str:
+    """Render a box menu from hashable arguments; same layout as _menu_box.
+    Every row is appended piecewise (ending in a newline) to flat part lists joined once at the end."""
+    parts: list[str] = [
+        "╔", "═" * width, "╗\n",
+        "║", MENU_BOLD, title[:width].ljust(width), MENU_COLOR_RESET, "║\n",
+        "╠", "═" * width, "╣\n",
+    ]
+    option_parts: list[str] = []
     for opt in options:
         if isinstance(opt, tuple):
             text = opt[0]
@@ -1643,45 +1963,42 @@ def _menu_box(
             red = opt[2] if len(opt) >= 3 else False
         else:
             text, enabled, red = opt, True, False
-        content = text[:width].ljust(width)
         if not enabled:
             color = MENU_COLOR_DISABLED
         elif red:
             color = MENU_COLOR_RED
         else:
             color = MENU_COLOR_BLACK
-        lines.append("║" + color + content + MENU_COLOR_RESET + "║")
-    middle_lines: list[str] = []
-    if middle:
-        for m in middle:
-            if isinstance(m, tuple):
-                bold_part, rest = m[0], m[1]
-                full = bold_part + rest
-                wrapped = _wrap_text(full, width - 4)  # Leave room for padding
-                for i, wrapped_line in enumerate(wrapped):
-                    if i == 0:
-                        # First line: make only bold_part bold
-                        bold_len = len(bold_part)
-                        bold_text = wrapped_line[:bold_len]
-                        rest_text = wrapped_line[bold_len:width - 4]
-                        # Build content: padding + bold + text + reset + rest + padding
-                        content = "  " + MENU_BOLD + bold_text + MENU_COLOR_RESET + rest_text
-                        # Pad to width, accounting for invisible ANSI codes
-                        visible_len = len("  ") + len(bold_text) + len(rest_text)
-                        padding_needed = width - 2 - visible_len
-                        content = content + (" " * padding_needed) + "  "
-                        middle_lines.append("║" + content + "║")
-                    else:
-                        # Subsequent lines have no bold
-                        padded_line = "  " + wrapped_line[:width - 4].ljust(width - 4) + "  "
-                        middle_lines.append("║" + padded_line + "║")
-            else:
-                for wrapped_line in _wrap_text(m, width):
-                    content = wrapped_line[:width].ljust(width)
-                    middle_lines.append("║" + MENU_BOLD + content + MENU_COLOR_RESET + "║")
-    if middle_lines and middle_position == "bottom":
-        return "\n".join([border, lines[0], sep] + lines[1:] + [sep] + middle_lines + [bottom])
-    return "\n".join([border, lines[0], sep] + middle_lines + lines[1:] + [bottom])
+        option_parts.extend(("║", color, text[:width].ljust(width), MENU_COLOR_RESET, "║\n"))
+    middle_parts: list[str] = []
+    for m in middle:
+        if isinstance(m, tuple):
+            bold_part, rest = m[0], m[1]
+            full = bold_part + rest
+            wrapped = _wrap_text(full, width - 4)  # Leave room for padding
+            for i, wrapped_line in enumerate(wrapped):
+                if i == 0:
+                    # First line: make only bold_part bold
+                    bold_text = wrapped_line[:len(bold_part)]
+                    # Pad only the visible text after the bold run (ANSI codes take no columns)
+                    rest_text = wrapped_line[len(bold_part):width - 4].ljust(width - 4 - len(bold_text))
+                    # padding + bold + text + reset + rest (padded) + padding
+                    middle_parts.extend(("║  ", MENU_BOLD, bold_text, MENU_COLOR_RESET, rest_text, "  ║\n"))
+                else:
+                    # Subsequent lines have no bold
+                    middle_parts.extend(("║  ", wrapped_line[:width - 4].ljust(width - 4), "  ║\n"))
+        else:
+            for wrapped_line in _wrap_text(m, width):
+                middle_parts.extend(("║", MENU_BOLD, wrapped_line[:width].ljust(width), MENU_COLOR_RESET, "║\n"))
+    if middle_parts and middle_position == "bottom":
+        parts += option_parts
+        parts.extend(("╠", "═" * width, "╣\n"))
+        parts += middle_parts
+    else:
+        parts += middle_parts
+        parts += option_parts
+    parts.extend(("╚", "═" * width, "╝"))
+    return "".join(parts)
 
 
 def _run_submenu(
@@ -1690,18 +2007,23 @@ def _run_submenu(
     actions: dict[int, Callable[[], None | bool]],
 ) -> None:
     """Display a sub-menu in a loop. Option max_option is Back; others run actions[choice].
-    If an action returns True, skip the 'Press Enter' pause (e.g. after returning from a sub-menu)."""
+    If an action returns True, skip the 'Press Enter' pause (e.g. after returning from a sub-menu).
+    Invalid input re-prompts under the menu already on screen instead of redrawing it."""
     prompt = f"Select an option (1–{max_option}): "
+    needs_redraw = True
     while True:
-        _clear_screen()
-        print(menu)
+        if needs_redraw:
+            _clear_screen()
+            _emit([menu])
         choice = _prompt_choice(prompt, max_option)
         if choice == 0:
+            # Menu is still on screen: report and re-prompt without clearing and repainting it
             print("Invalid option.")
-            _pause()
+            needs_redraw = False
             continue
         if choice == max_option:
             return
+        needs_redraw = True
         if choice in actions:
             result = actions[choice]()
             if result is not True:
@@ -1712,54 +2034,93 @@ def _run_submenu(
 # DIRECT REPORTS — model helpers, load/save, list/add/delete/generate/purge
 # ============================================================================
 
+def _seed_direct_report_id_counter() -> None:
+    """Set the id counter to one past the largest numeric id in direct_reports."""
+    global _direct_report_id_counter
+    _direct_report_id_counter = 1 + max(
+        (int(r["id"]) for r in direct_reports if str(r.get("id", "")).isdigit()),
+        default=0,
+    )
+
+
+def _has_valid_direct_report_id(r: dict[str, Any]) -> bool:
+    """True if r["id"] is a positive int or an all-digit string (classified without try/except)."""
+    rid = r.get("id")
+    if isinstance(rid, int):
+        return rid > 0
+    return isinstance(rid, str) and rid.isdigit() and int(rid) > 0
+
+
 def _next_direct_report_id() -> int:
-    """Return the next available id for a new direct report."""
-    max_id = 0
-    for r in direct_reports:
-        try:
-            max_id = max(max_id, int(r.get("id") or 0))
-        except (TypeError, ValueError):
-            pass
-    return max_id + 1
+    """Return the next available id for a new direct report (counter seeded at load, bumped per call)."""
+    global _direct_report_id_counter
+    if _direct_report_id_counter <= 0:
+        _seed_direct_report_id_counter()
+    value = _direct_report_id_counter
+    _direct_report_id_counter += 1
+    return value
 
 
 def _direct_report_name_key(r: dict[str, Any]) -> str:
-    """Return a normalized key for first_name + last_name (for duplicate check)."""
+    """Return a normalized key for first_name + last_name (for duplicate check).
+    Uses the cached ``_name_key`` when present (see _cache_direct_report_name_key)."""
+    cached = r.get("_name_key")
+    if cached:
+        return cached
     first = (r.get("first_name") or "").strip().lower()
     last = (r.get("last_name") or "").strip().lower()
     return f"{first}|{last}"
 
 
+def _cache_direct_report_name_key(r: dict[str, Any]) -> dict[str, Any]:
+    """Store the normalized name key on an in-memory report as ``_name_key``; returns r.
+    Underscore keys are private to the CLI list and never written to JSON or the database."""
+    r.pop("_name_key", None)
+    r["_name_key"] = _direct_report_name_key(r)
+    return r
+
+
 def _is_duplicate_direct_report(data: dict[str, Any], existing_keys: set[str]) -> bool:
     """Return True if this report's first_name+last_name is already in existing_keys."""
     key = _direct_report_name_key(data)
     return bool(key and key in existing_keys)
 
 
+# Legacy camelCase keys → Direct_Reports column names
+_DIRECT_REPORT_KEY_MAP = {
+    "firstName": "first_name", "lastName": "last_name",
+    "birthdate": "birthday", "hireDate": "hire_date", "partnerName": "partner_name",
+}
+# Every Direct_Reports key with its default; filled into records by _normalize_direct_report
+_DIRECT_REPORT_TEMPLATE: dict[str, Any] = {
+    "id": None,
+    "first_name": "",
+    "last_name": "",
+    **{k: None for k in DIRECT_REPORT_OPTIONAL_KEYS},
+}
+
+
 def _normalize_direct_report(r: dict[str, Any]) -> dict[str, Any]:
-    """Ensure dict has Direct_Reports table keys; migrate old camelCase keys."""
-    key_map = {
-        "firstName": "first_name", "lastName": "last_name",
-        "birthdate": "birthday", "hireDate": "hire_date", "partnerName": "partner_name",
-    }
-    out: dict[str, Any] = {}
-    for k, v in r.items():
-        out[key_map.get(k, k)] = v
-    # Required: id (keep if present), first_name, last_name
-    if "first_name" not in out or out["first_name"] is None:
-        out["first_name"] = ""
-    if "last_name" not in out or out["last_name"] is None:
-        out["last_name"] = ""
-    # Optional
-    for key in DIRECT_REPORT_OPTIONAL_KEYS:
-        if key not in out:
-            out[key] = None
-    return out
+    """Ensure dict has Direct_Reports table keys; migrate old camelCase keys.
+    Normalizes r in place and returns it (every caller passes a freshly built dict)."""
+    keys = r.keys()
+    if not keys.isdisjoint(_DIRECT_REPORT_KEY_MAP):
+        for old, new in _DIRECT_REPORT_KEY_MAP.items():
+            if old in r:
+                r[new] = r.pop(old)
+    if not keys >= _DIRECT_REPORT_TEMPLATE.keys():
+        for k, default in _DIRECT_REPORT_TEMPLATE.items():
+            r.setdefault(k, default)
+    # Required: id (None until assigned), first_name, last_name
+    r["first_name"] = r["first_name"] or ""
+    r["last_name"] = r["last_name"] or ""
+    return r
 
 
 def _load_direct_reports() -> None:
     """Load direct_reports into memory from SQLite when available; else from JSON. Mirror to JSON after DB load."""
     global direct_reports
+    _migrate_direct_reports_json_file()
     if _db_available:
         try:
             from_db = _db_load_direct_reports()
@@ -1767,33 +2128,22 @@ def _load_direct_reports() -> None:
             from_db = []
         if from_db:
             direct_reports = from_db
-            next_id = _next_direct_report_id()
+            _seed_direct_report_id_counter()
             for r in direct_reports:
-                try:
-                    if int(r.get("id") or 0) <= 0:
-                        r["id"] = next_id
-                        next_id += 1
-                except (TypeError, ValueError):
-                    r["id"] = next_id
-                    next_id += 1
+                if not _has_valid_direct_report_id(r):
+                    r["id"] = _next_direct_report_id()
+                _cache_direct_report_name_key(r)
             _write_direct_reports_json_file(direct_reports)
             return
     if os.path.isfile(DIRECT_REPORTS_FILE):
         try:
-            with open(DIRECT_REPORTS_FILE, encoding="utf-8") as f:
-                data = json.load(f)
-            raw = data if isinstance(data, list) else []
-            direct_reports = [_normalize_direct_report(r) for r in raw if isinstance(r, dict)]
-            next_id = _next_direct_report_id()
+            direct_reports = [_normalize_direct_report(r) for r in _read_direct_reports_file(DIRECT_REPORTS_FILE)]
+            _seed_direct_report_id_counter()
             for r in direct_reports:
-                try:
-                    if int(r.get("id") or 0) <= 0:
-                        r["id"] = next_id
-                        next_id += 1
-                except (TypeError, ValueError):
-                    r["id"] = next_id
-                    next_id += 1
-        except (json.JSONDecodeError, OSError):
+                if not _has_valid_direct_report_id(r):
+                    r["id"] = _next_direct_report_id()
+                _cache_direct_report_name_key(r)
+        except (ValueError, OSError):  # ValueError covers JSONDecodeError and UnicodeDecodeError
             direct_reports = []
     else:
         direct_reports = []
@@ -1805,14 +2155,22 @@ def _load_direct_reports() -> None:
     _write_direct_reports_json_file(direct_reports)
 
 
-def _save_direct_reports() -> None:
-    """Persist in-memory direct_reports: database first (full replace), then JSON mirror."""
+def _save_direct_reports(ops: list[dict[str, Any]] | None = None) -> None:
+    """Persist in-memory direct_reports: database first, then JSON mirror.
+    With ops (the add/del journal entries for this change) only those rows are written to the database
+    and the mirror is appended to; without them both are fully rewritten."""
     if _db_available:
         try:
-            _db_replace_direct_reports_from_list(direct_reports)
+            if ops is not None:
+                _db_apply_direct_report_ops(ops)
+            else:
+                _db_replace_direct_reports_from_list(direct_reports)
         except Exception as e:
             print(f"Could not save direct reports to database: {e}", file=sys.stderr)
-    _write_direct_reports_json_file(direct_reports)
+    if ops is not None and os.path.isfile(DIRECT_REPORTS_FILE):
+        _append_direct_report_ops(ops, direct_reports)
+    else:
+        _write_direct_reports_json_file(direct_reports)
 
 
 # ============================================================================
@@ -1834,42 +2192,55 @@ _LIST_DIRECT_REPORT_COLUMNS = (
     ("partner_name", "Partner", 14),
 )
 
+# Table layout derived once from the (immutable) column definitions
+_LIST_FMT = " ".join(
+    [f"{{:>{_LIST_DIRECT_REPORT_COLUMNS[0][2]}}}"] + [f"{{:{c[2]}}}" for c in _LIST_DIRECT_REPORT_COLUMNS[1:]]
+)
+_LIST_TOTAL_WIDTH = sum(c[2] for c in _LIST_DIRECT_REPORT_COLUMNS) + len(_LIST_DIRECT_REPORT_COLUMNS) - 1
+_LIST_SEP = "-" * _LIST_TOTAL_WIDTH
+_LIST_HEADERS = tuple(c[1] for c in _LIST_DIRECT_REPORT_COLUMNS)
+_LIST_HEADER_LINE = _LIST_FMT.format(*_LIST_HEADERS)
+_LIST_WIDTHS = tuple(c[2] for c in _LIST_DIRECT_REPORT_COLUMNS)
+# Reports are normalized, so every column key is present: one C-level tuple pull per row
+_LIST_ROW_GETTER = operator.itemgetter(*[c[0] for c in _LIST_DIRECT_REPORT_COLUMNS])
+
+
+def _direct_reports_table_lines(reports: list[dict[str, Any]]) -> list[str]:
+    """Lines of the direct reports table: header, one row per report, total."""
+    lines = [_LIST_HEADER_LINE, _LIST_SEP]
+    lines.extend(
+        _LIST_FMT.format(*[str(val)[:width] if val else "" for val, width in zip(_LIST_ROW_GETTER(r), _LIST_WIDTHS)])
+        for r in reports
+    )
+    lines.append(_LIST_SEP)
+    lines.append(f"Total: {len(reports)}")
+    return lines
+
 
 def _print_direct_reports_table(reports: list[dict[str, Any]], title: str) -> None:
     """Print a table of direct reports (database listing)."""
-    cols = _LIST_DIRECT_REPORT_COLUMNS
-    fmt_parts = [f"{{:>{cols[0][2]}}}"] + [f"{{:{c[2]}}}" for c in cols[1:]]
-    fmt = " ".join(fmt_parts)
-    total_width = sum(c[2] for c in cols) + len(cols) - 1
-    sep = "-" * total_width
-    headers = [c[1] for c in cols]
-    print(fmt.format(*headers))
-    print(sep)
-    for r in reports:
-        row = []
-        for key, _header, width in cols:
-            val = r.get(key)
-            if val is None:
-                val = ""
-            s = str(val)[:width] if val else ""
-            row.append(s)
-        print(fmt.format(*row))
-    print(sep)
-    print(f"Total: {len(reports)}")
+    _emit(_direct_reports_table_lines(reports))
 
 
 def _list_direct_reports() -> None:
     """Display direct reports from the database."""
-    print("\n--- Direct Reports (database) ---\n")
+    lines = ["\n--- Direct Reports (database) ---\n"]
     try:
         db_reports = _db_load_direct_reports()
         if not db_reports:
-            print("  No direct reports in database.")
+            lines.append("  No direct reports in database.")
         else:
-            _print_direct_reports_table(db_reports, "")
+            lines.extend(_direct_reports_table_lines(db_reports))
     except Exception as e:
-        print(f"  Error loading from database: {e}")
-    print("\nAdd or delete from the menu; data is saved to both file and database.")
+        lines.append(f"  Error loading from database: {e}")
+    lines.append("\nAdd or delete from the menu; data is saved to both file and database.")
+    _emit(lines)
+
+
+# Dashes and spaces are dropped before the 8-digit check, so 1990-05-15, 1990 05 15 and 19900515 all parse
+_DATE_SEPARATORS = str.maketrans("", "", "- ")
+# Otherwise exactly what strptime's %Y-%m-%d accepted: unpadded month/day (2022-3-5) or a space-padded day
+_UNPADDED_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2}| \d)$")
 
 
 def _parse_optional_date(prompt: str) -> date | None:
@@ -1878,20 +2249,15 @@ def _parse_optional_date(prompt: str) -> date | None:
         raw = input(prompt).strip()
         if not raw:
             return None
-        # Allow digits only (e.g. 19900515) or with hyphens/spaces
-        digits_only = raw.replace("-", "").replace(" ", "")
-        if digits_only.isdigit() and len(digits_only) == 8:
-            try:
-                return date(
-                    int(digits_only[0:4]),
-                    int(digits_only[4:6]),
-                    int(digits_only[6:8]),
-                )
-            except ValueError:
-                pass
+        digits = raw.translate(_DATE_SEPARATORS)
+        if len(digits) == 8 and digits.isdigit():
+            ymd: tuple[str, str, str] | None = (digits[:4], digits[4:6], digits[6:])
         else:
+            m = _UNPADDED_DATE_RE.fullmatch(raw)
+            ymd = (m[1], m[2], m[3]) if m else None
+        if ymd:
             try:
-                return datetime.strptime(raw, "%Y-%m-%d").date()
+                return date(int(ymd[0]), int(ymd[1]), int(ymd[2]))
             except ValueError:
                 pass
         print("  Invalid date. Use YYYY-MM-DD or YYYYMMDD (e.g. 2022-03-15 or 20220315). Try again.")
@@ -1924,8 +2290,8 @@ def _add_direct_report() -> None:
     rsd = _parse_optional_date("Role start date (YYYYMMDD or YYYY-MM-DD, or Enter to skip): ")
     report["role_start_date"] = rsd.isoformat() if rsd else None
     report["partner_name"] = input("Partner name (or Enter to skip): ").strip() or None
-    direct_reports.append(report)
-    _save_direct_reports()
+    direct_reports.append(_cache_direct_report_name_key(report))
+    _save_direct_reports([_direct_report_add_op(report)])
     print(f"\nAdded: {report['first_name']} {report['last_name']}")
     #_list_direct_reports()
 
@@ -1943,7 +2309,7 @@ def _delete_direct_report() -> None | bool:
         index = next((i for i, r in enumerate(direct_reports) if r.get("id") == target_id), None)
         if index is not None:
             removed = direct_reports.pop(index)
-            _save_direct_reports()
+            _save_direct_reports([{"op": "del", "id": target_id}])
             print(f"Removed: {removed.get('first_name', '')} {removed.get('last_name', '')}")
         else:
             print(f"No direct report with ID {target_id}.")
@@ -1951,9 +2317,21 @@ def _delete_direct_report() -> None | bool:
         print("Invalid input. Enter the ID number (e.g. from the list above).")
 
 
+def _avoid_existing_names_instruction(reports: list[dict[str, Any]]) -> str:
+    """Prompt sentence naming up to 30 existing reports the model must not recreate ('' if none).
+    Reports are normalized, so first_name/last_name are always strings."""
+    if not reports:
+        return ""
+    names = ", ".join(f"{r['first_name']} {r['last_name']}".strip() for r in reports[:30])
+    return (
+        "\nDo NOT create any person with the same first and last name as any of these existing people: "
+        f"{names}. All new reports must have unique first and last names."
+    )
+
+
 def _generate_direct_reports_with_ai() -> None:
     """Generate realistic direct reports using Mistral AI and add them to the list."""
-    if not MISTRAL_AVAILABLE:
+    if not _ensure_mistral_sdk():
         print("\nMistral AI is not installed. Install it with: pip install mistralai")
         return
     
@@ -1977,12 +2355,9 @@ def _generate_direct_reports_with_ai() -> None:
     print(f"\nGenerating {num} direct reports using Mistral AI...\n")
     
     try:
-        client = Mistral(api_key=api_key)
+        client = _get_mistral_client(api_key)
         existing_names = {_direct_report_name_key(r) for r in direct_reports}
-        avoid_names_instruction = ""
-        if existing_names:
-            names_list = [f"{r.get('first_name', '')} {r.get('last_name', '')}".strip() for r in direct_reports[:30]]
-            avoid_names_instruction = f"\nDo NOT create any person with the same first and last name as any of these existing people: {names_list}. All new reports must have unique first and last names."
+        avoid_names_instruction = _avoid_existing_names_instruction(direct_reports)
         prompt = f"""Generate exactly {num} realistic direct reports for a manager. Each report should have a diverse, realistic background.{avoid_names_instruction}
 
 Return a single JSON object with a key "reports" whose value is an array of {num} objects. Each object must have exactly these keys (use null for optional fields if needed): first_name, last_name, street_address_1, street_address_2, city, state, zipcode, country, birthday, hire_date, current_role, role_start_date, partner_name. Dates must be YYYY-MM-DD. Each person must have a unique first_name and last_name combination. Example structure:
@@ -2009,55 +2384,34 @@ Output only this JSON object, no other text."""
             )
         else:
             raw = msg_content or ""
-        response_text = raw.strip()
-        # Strip markdown code fence if model still adds it
-        if response_text.startswith("```"):
-            end = response_text.find("\n", 3)
-            if end != -1:
-                response_text = response_text[end + 1 :].rstrip()
-            if response_text.endswith("```"):
-                response_text = response_text[:-3].rstrip()
-
-        objects: list[dict] = []
-        try:
-            parsed = json.loads(response_text)
-            if isinstance(parsed, dict):
-                arr = parsed.get("reports") or parsed.get("direct_reports")
-                if isinstance(arr, list):
-                    objects = [x for x in arr if isinstance(x, dict)]
-                if not objects:
-                    for v in parsed.values():
-                        if isinstance(v, list) and v and isinstance(v[0], dict):
-                            objects = [x for x in v if isinstance(x, dict)]
-                            break
-            elif isinstance(parsed, list):
-                objects = [x for x in parsed if isinstance(x, dict)]
-        except (json.JSONDecodeError, TypeError):
-            pass
+        objects = _parse_mistral_json_objects(raw, ("reports", "direct_reports"))
         if not objects and os.environ.get("WINGMANEM_DEBUG"):
             print(f"[Debug] Raw response (first 800 chars):\n{raw[:800]!r}", file=sys.stderr)
-        keys_already_used = set(existing_names)
-        added_count = 0
+        keys_already_used = existing_names  # local set; extended as reports are added
+        new_reports: list[dict[str, Any]] = []
+        status_lines: list[str] = []
         for data in objects:
-            if _is_duplicate_direct_report(data, keys_already_used):
-                fn = (data.get("first_name") or "").strip()
-                ln = (data.get("last_name") or "").strip()
-                print(f"  Skipped duplicate: {fn} {ln}")
-                continue
+            # Normalize first so the duplicate check is one cached-key lookup; id assigned only if kept
             try:
-                report = _normalize_direct_report({
-                    "id": _next_direct_report_id(),
-                    **data
-                })
-                direct_reports.append(report)
-                keys_already_used.add(_direct_report_name_key(report))
-                added_count += 1
-                print(f"  ✓ Added: {report['first_name']} {report['last_name']}")
-            except (ValueError, TypeError):
-                pass
-        
+                report = _cache_direct_report_name_key(_normalize_direct_report({"id": None, **data}))
+            except (ValueError, TypeError, AttributeError):
+                continue
+            key = report["_name_key"]
+            if key in keys_already_used:
+                status_lines.append(f"  Skipped duplicate: {report['first_name'].strip()} {report['last_name'].strip()}")
+                continue
+            report["id"] = _next_direct_report_id()
+            new_reports.append(report)
+            keys_already_used.add(key)
+            status_lines.append(f"  ✓ Added: {report['first_name']} {report['last_name']}")
+        # One extend, one status write, one save for the whole batch
+        direct_reports.extend(new_reports)
+        added_count = len(new_reports)
+        if status_lines:
+            print("\n".join(status_lines))
+
         if added_count > 0:
-            _save_direct_reports()
+            _save_direct_reports([_direct_report_add_op(r) for r in new_reports])
             print(f"\nSuccessfully added {added_count} direct reports.")
         else:
             print("\nCould not parse any valid direct reports from the response.")
@@ -2077,7 +2431,7 @@ Output only this JSON object, no other text."""
 
 def _generate_direct_reports_with_ai_for_user(owner_user_id: int, num: int) -> int:
     """Web: generate up to num Mistral direct reports owned by owner_user_id. Returns count added."""
-    if not MISTRAL_AVAILABLE:
+    if not _ensure_mistral_sdk():
         return 0
     api_key = _get_mistral_api_key()
     if not api_key:
@@ -2085,12 +2439,9 @@ def _generate_direct_reports_with_ai_for_user(owner_user_id: int, num: int) -> i
     num = max(1, min(10, int(num)))
     current = _db_load_direct_reports_for_user(owner_user_id)
     try:
-        client = Mistral(api_key=api_key)
+        client = _get_mistral_client(api_key)
         existing_names = {_direct_report_name_key(r) for r in current}
-        avoid_names_instruction = ""
-        if existing_names:
-            names_list = [f"{r.get('first_name', '')} {r.get('last_name', '')}".strip() for r in current[:30]]
-            avoid_names_instruction = f"\nDo NOT create any person with the same first and last name as any of these existing people: {names_list}. All new reports must have unique first and last names."
+        avoid_names_instruction = _avoid_existing_names_instruction(current)
         prompt = f"""Generate exactly {num} realistic direct reports for a manager. Each report should have a diverse, realistic background.{avoid_names_instruction}
 
 Return a single JSON object with a key "reports" whose value is an array of {num} objects. Each object must have exactly these keys (use null for optional fields if needed): first_name, last_name, street_address_1, street_address_2, city, state, zipcode, country, birthday, hire_date, current_role, role_start_date, partner_name. Dates must be YYYY-MM-DD. Each person must have a unique first_name and last_name combination. Example structure:
@@ -2116,38 +2467,13 @@ Output only this JSON object, no other text."""
             )
         else:
             raw = msg_content or ""
-        response_text = raw.strip()
-        if response_text.startswith("```"):
-            end = response_text.find("\n", 3)
-            if end != -1:
-                response_text = response_text[end + 1 :].rstrip()
-            if response_text.endswith("```"):
-                response_text = response_text[:-3].rstrip()
-
-        objects: list[dict] = []
-        try:
-            parsed = json.loads(response_text)
-            if isinstance(parsed, dict):
-                arr = parsed.get("reports") or parsed.get("direct_reports")
-                if isinstance(arr, list):
-                    objects = [x for x in arr if isinstance(x, dict)]
-                if not objects:
-                    for v in parsed.values():
-                        if isinstance(v, list) and v and isinstance(v[0], dict):
-                            objects = [x for x in v if isinstance(x, dict)]
-                            break
-            elif isinstance(parsed, list):
-                objects = [x for x in parsed if isinstance(x, dict)]
-        except (json.JSONDecodeError, TypeError):
-            pass
+        objects = _parse_mistral_json_objects(raw, ("reports", "direct_reports"))
 
-        keys_already_used = set(existing_names)
+        keys_already_used = existing_names  # local set; extended as reports are added
         added_count = 0
         merged = list(current)
         next_id = _db_next_direct_report_id()
         for data in objects:
-            if _is_duplicate_direct_report(data, keys_already_used):
-                continue
             try:
                 report = _normalize_direct_report(
                     {
@@ -2156,12 +2482,15 @@ Output only this JSON object, no other text."""
                         "owner_user_id": owner_user_id,
                     }
                 )
-                merged.append(report)
-                keys_already_used.add(_direct_report_name_key(report))
-                next_id += 1
-                added_count += 1
-            except (ValueError, TypeError):
-                pass
+                key = _direct_report_name_key(report)
+            except (ValueError, TypeError, AttributeError):
+                continue
+            if key in keys_already_used:
+                continue
+            merged.append(report)
+            keys_already_used.add(key)
+            next_id += 1
+            added_count += 1
         if added_count > 0:
             _save_direct_reports_for_user(owner_user_id, merged)
         return added_count
@@ -2194,6 +2523,7 @@ def _load_management_tips() -> None:
     """Load tips: prefer SQLite; else JSON. Mirror to JSON after DB load. Then seed today’s tip via Mistral if needed."""
     global management_tips
     today_str = date.today().isoformat()
+    _migrate_management_tips_json_file()
     if _db_available:
         try:
             db_tips = _db_load_management_tips()
@@ -2204,7 +2534,7 @@ def _load_management_tips() -> None:
             _write_management_tips_json_file(management_tips)
             last_date = management_tips[-1]["date"] if management_tips else None
             need_new_tip = not management_tips or last_date != today_str
-            if need_new_tip and MISTRAL_AVAILABLE and _get_mistral_api_key():
+            if need_new_tip and _get_mistral_api_key() and _ensure_mistral_sdk():
                 n_users = _db_count_app_users()
                 if n_users == 0:
                     _generate_management_tip_with_ai(silent=True, owner_user_id=None)
@@ -2218,18 +2548,14 @@ def _load_management_tips() -> None:
         _save_management_tips()
     else:
         try:
-            with open(MANAGEMENT_TIPS_FILE, encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, list):
-                management_tips = []
-                for item in data:
-                    if isinstance(item, dict) and item.get("date") and item.get("text"):
-                        management_tips.append({"date": str(item["date"])[:10], "text": str(item["text"]).strip()})
-                    elif isinstance(item, str) and item.strip():
-                        management_tips.append({"date": today_str, "text": item.strip()})
-            else:
-                management_tips = []
-        except (json.JSONDecodeError, OSError):
+            data = _read_management_tips_file(MANAGEMENT_TIPS_FILE)
+            management_tips = []
+            for item in data:
+                if isinstance(item, dict) and item.get("date") and item.get("text"):
+                    management_tips.append({"date": str(item["date"])[:10], "text": str(item["text"]).strip()})
+                elif isinstance(item, str) and item.strip():
+                    management_tips.append({"date": today_str, "text": item.strip()})
+        except (ValueError, OSError):
             management_tips = []
     if _db_available:
         try:
@@ -2239,7 +2565,7 @@ def _load_management_tips() -> None:
     _write_management_tips_json_file(management_tips)
     last_date = management_tips[-1]["date"] if management_tips else None
     need_new_tip = not management_tips or last_date != today_str
-    if need_new_tip and MISTRAL_AVAILABLE and _get_mistral_api_key():
+    if need_new_tip and _get_mistral_api_key() and _ensure_mistral_sdk():
         n_users = _db_count_app_users()
         if n_users == 0:
             _generate_management_tip_with_ai(silent=True, owner_user_id=None)
@@ -2271,20 +2597,13 @@ def _normalize_tip_for_comparison(tip: str) -> str:
     return " ".join(tip.lower().split())
 
 
-def _is_duplicate_management_tip_against(text: str, entries: list[dict[str, Any]]) -> bool:
-    """Return True if tip text matches any entry's text (normalized)."""
-    if not text:
-        return False
-    normalized_new = _normalize_tip_for_comparison(text)
-    for entry in entries:
-        if _normalize_tip_for_comparison(str(entry.get("text") or "")) == normalized_new:
-            return True
-    return False
-
-
-def _is_duplicate_management_tip(text: str) -> bool:
-    """Return True if the tip text is effectively a duplicate of any existing tip in management_tips."""
-    return _is_duplicate_management_tip_against(text, management_tips)
+# Themes for the no-history tip prompt (random pick per attempt)
+_TIP_THEMES = (
+    "delegation", "conflict resolution", "motivation", "career growth",
+    "running meetings", "prioritization", "remote work", "recognition",
+    "1:1 conversations", "accountability", "giving feedback", "hiring",
+    "burnout prevention", "goal setting", "difficult conversations",
+)
 
 
 def _generate_management_tip_with_ai(*, silent: bool = False, owner_user_id: int | None = None) -> bool:
@@ -2293,7 +2612,7 @@ def _generate_management_tip_with_ai(*, silent: bool = False, owner_user_id: int
     If silent is True, do not print success message (e.g. when seeding on startup).
     When owner_user_id is set, the row is stored for that user only (web multi-tenant). When None, owner is NULL (CLI / pre-auth)."""
     global management_tips
-    if not MISTRAL_AVAILABLE:
+    if not _ensure_mistral_sdk():
         if not silent:
             print("\nMistral AI is not installed. Install it with: pip install mistralai")
         return False
@@ -2310,26 +2629,26 @@ Keep it to one or two sentences. No bullet points or numbering. Output only the
         tip_history = _db_load_management_tips_for_user(owner_user_id)
     else:
         tip_history = list(management_tips)
-    try:
-        client = Mistral(api_key=api_key)
-        for attempt in range(max_attempts):
-            avoid_all = [e["text"] for e in tip_history[-20:]]
-            if avoid_all:
-                avoid = "; ".join(repr(t) for t in avoid_all)
-                prompt = f"""{base_prompt}
+    # Normalize history once; each retry is then a single set lookup
+    seen_tips = {_normalize_tip_for_comparison(str(e.get("text") or "")) for e in tip_history}
+    # The history does not change between retries, so the avoid-list prompt is built once
+    avoid_all = [e["text"] for e in tip_history[-20:]]
+    history_prompt: str | None = None
+    if avoid_all:
+        avoid = "; ".join(repr(t) for t in avoid_all)
+        history_prompt = f"""{base_prompt}
 
 Do NOT suggest any of these tips (already in your history). Suggest something different:
 {avoid}"""
+    try:
+        client = _get_mistral_client(api_key)
+        for attempt in range(max_attempts):
+            if history_prompt is not None:
+                prompt = history_prompt
             else:
                 # No history (e.g. file missing): pick a random theme so we get a different tip each time
                 today_str = date.today().isoformat()
-                themes = [
-                    "delegation", "conflict resolution", "motivation", "career growth",
-                    "running meetings", "prioritization", "remote work", "recognition",
-                    "1:1 conversations", "accountability", "giving feedback", "hiring",
-                    "burnout prevention", "goal setting", "difficult conversations",
-                ]
-                theme = random.choice(themes)
+                theme = random.choice(_TIP_THEMES)
                 prompt = f"""Today is {today_str}. Generate exactly one short, actionable daily management tip for an engineering manager.
 Focus specifically on: {theme}. Give one concrete tip (not generic advice like "listen to your team"). One or two sentences only. Output only the tip text, nothing else."""
             message = client.chat.complete(
@@ -2341,18 +2660,16 @@ Focus specifically on: {theme}. Give one concrete tip (not generic advice like "
                 if not silent and attempt == max_attempts - 1:
                     print("\nMistral AI returned an empty tip.")
                 continue
-            if _is_duplicate_management_tip_against(text, tip_history):
+            if _normalize_tip_for_comparison(text) in seen_tips:
                 continue
             d = date.today().isoformat()
             _db_insert_management_tip(owner_user_id, d, text)
-            management_tips.clear()
-            management_tips.extend(_db_load_management_tips())
-            try:
-                _write_management_tips_json_file(
-                    [{"date": x["date"], "text": x["text"]} for x in management_tips]
-                )
-            except OSError:
-                pass
+            entry: dict[str, Any] = {"date": d, "text": text}
+            _append_management_tip(entry)
+            # Same shape the file loader produces; owner only for web (per-user) tips
+            if owner_user_id is not None:
+                entry["owner_user_id"] = owner_user_id
+            management_tips.append(entry)
             if not silent:
                 print(f"\nDaily tip generated: {text}")
             return True
@@ -2391,60 +2708,97 @@ def _print_management_tips_by_date() -> None:
 # MILESTONE REMINDERS — birthdays & anniversaries (from database)
 # ============================================================================
 
-def _compute_milestones_from_reports(reports: list[dict[str, Any]], range_days: int) -> list[tuple[int, str]]:
-    """Compute upcoming birthdays and anniversaries for the next range_days. Returns sorted list of (days_until, msg)."""
+def _parse_milestone_dates(reports: list[dict[str, Any]]) -> list[tuple[str, tuple[int, int, int] | None, tuple[int, int, int] | None]]:
+    """Parse birthday/hire_date once per report into (name, (year, month, day) | None, (year, month, day) | None).
+    Stored dates are unvalidated form or model text, so this accepts exactly what strptime("%Y-%m-%d") did
+    (unpadded month/day included, via _UNPADDED_DATE_RE); anything else is None."""
+    parsed: list[tuple[str, tuple[int, int, int] | None, tuple[int, int, int] | None]] = []
+    for r in reports:
+        ymd: list[tuple[int, int, int] | None] = []
+        for key in ("birthday", "hire_date"):
+            raw = r.get(key)
+            m = _UNPADDED_DATE_RE.fullmatch(raw) if isinstance(raw, str) else None  # fullmatch: no "\n" before $
+            d = None
+            if m:
+                try:
+                    d = date(int(m[1]), int(m[2]), int(m[3]))
+                except ValueError:
+                    pass
+            ymd.append((d.year, d.month, d.day) if d else None)
+        parsed.append((f"{r.get('first_name', '')} {r.get('last_name', '')}", ymd[0], ymd[1]))
+    return parsed
+
+
+def _next_milestone_date(today: date, month: int, day: int) -> date | None:
+    """Next occurrence of month/day on or after today. Feb 29 has one only when today's year is
+    a leap year and the day has not passed (the following year never is); otherwise None."""
+    leap_day = month == 2 and day == 29
+    # Gregorian leap-year rule inline (calendar.isleap would pull in calendar and locale at import)
+    if leap_day and not (today.year % 4 == 0 and (today.year % 100 != 0 or today.year % 400 == 0)):
+        return None
+    this_year = date(today.year, month, day)
+    if this_year >= today:
+        return this_year
+    if leap_day:
+        return None
+    return date(today.year + 1, month, day)
+
+
+def _milestones_from_parsed(
+    parsed: list[tuple[str, tuple[int, int, int] | None, tuple[int, int, int] | None]], range_days: int
+) -> list[tuple[int, str]]:
+    """Upcoming birthdays and anniversaries from _parse_milestone_dates output. Returns sorted list of (days_until, msg).
+    Dates were validated when parsed, so the loop needs no exception handling."""
     today = date.today()
     upcoming: list[tuple[int, str]] = []
-    for r in reports:
-        bd = r.get("birthday")
-        if bd:
-            try:
-                bd_date = datetime.strptime(bd, "%Y-%m-%d").date()
-                next_bd = bd_date.replace(year=today.year)
+    for name, bd, hd in parsed:
+        if bd is not None:
+            next_bd = _next_milestone_date(today, bd[1], bd[2])
+            if next_bd is not None:
                 days_until = (next_bd - today).days
-                if days_until < 0:
-                    next_bd = bd_date.replace(year=today.year + 1)
-                    days_until = (next_bd - today).days
-                if 0 <= days_until <= range_days:
-                    upcoming.append((days_until, f"Birthday: {r['first_name']} {r['last_name']} on {next_bd.strftime('%Y-%m-%d')} ({days_until} days)"))
-            except Exception:
-                pass
-        hd = r.get("hire_date")
-        if hd:
-            try:
-                hd_date = datetime.strptime(hd, "%Y-%m-%d").date()
-                anniv = hd_date.replace(year=today.year)
+                if days_until <= range_days:
+                    upcoming.append((days_until, f"Birthday: {name} on {next_bd.isoformat()} ({days_until} days)"))
+        if hd is not None:
+            anniv = _next_milestone_date(today, hd[1], hd[2])
+            if anniv is not None:
                 days_until = (anniv - today).days
-                if days_until < 0:
-                    anniv = hd_date.replace(year=today.year + 1)
-                    days_until = (anniv - today).days
-                if 0 <= days_until <= range_days:
-                    years = anniv.year - hd_date.year
-                    upcoming.append((days_until, f"Anniversary: {r['first_name']} {r['last_name']} ({years} years) on {anniv.strftime('%Y-%m-%d')} ({days_until} days)"))
-            except Exception:
-                pass
+                if days_until <= range_days:
+                    years = anniv.year - hd[0]
+                    upcoming.append((days_until, f"Anniversary: {name} ({years} years) on {anniv.isoformat()} ({days_until} days)"))
     upcoming.sort()
-    return [(d, msg) for d, msg in upcoming]
+    return upcoming
+
+
+def _compute_milestones_from_reports(reports: list[dict[str, Any]], range_days: int) -> list[tuple[int, str]]:
+    """Compute upcoming birthdays and anniversaries for the next range_days. Returns sorted list of (days_until, msg)."""
+    return _milestones_from_parsed(_parse_milestone_dates(reports), range_days)
 
 
 def _view_milestone_reminders() -> None | bool:
     """Show upcoming birthdays and anniversaries from the database."""
 
+    # Every milestone falls within the next 366 days, so that list (sorted by days_until) is
+    # computed once and each range the user enters is a prefix of it
+    all_upcoming: list[tuple[int, str]] | None = None
+    days_keys: list[int] = []
+
     def _print_upcoming(range_days: int) -> None:
+        nonlocal all_upcoming, days_keys
         _clear_screen()
-        print("\n--- Milestone Reminders (database) ---\n")
-        print(f"Showing the next {range_days} days.\n")
+        lines = ["\n--- Milestone Reminders (database) ---\n", f"Showing the next {range_days} days.\n"]
         try:
-            db_reports = _db_load_direct_reports()
-            upcoming = _compute_milestones_from_reports(db_reports, range_days)
+            if all_upcoming is None:
+                all_upcoming = _milestones_from_parsed(_parse_milestone_dates(_db_load_direct_reports()), 366)
+                days_keys = [d for d, _ in all_upcoming]
+            upcoming = all_upcoming[:bisect.bisect_right(days_keys, range_days)]
             if not upcoming:
-                print("  No upcoming birthdays or anniversaries.")
+                lines.append("  No upcoming birthdays or anniversaries.")
             else:
-                for _, msg in upcoming:
-                    print(f"  {msg}")
+                lines.extend(f"  {msg}" for _, msg in upcoming)
         except Exception as e:
-            print(f"  Error loading from database: {e}")
-        print()
+            lines.append(f"  Error loading from database: {e}")
+        lines.append("")
+        _emit(lines)
 
     _print_upcoming(30)
     while True:
@@ -2491,7 +2845,7 @@ def _upload_one_to_one_recording() -> None:
     """Let user pick a direct report and audio file; transcribe with Mistral, summarize with action items; store in DB."""
     _clear_screen()
     print("\n--- Upload 1:1 Recording ---\n")
-    if not MISTRAL_AVAILABLE:
+    if not _ensure_mistral_sdk():
         print("Mistral AI is not installed. Install it with: pip install mistralai")
         return
     api_key = _get_mistral_api_key()
@@ -2511,7 +2865,7 @@ def _upload_one_to_one_recording() -> None:
     filename = os.path.basename(path)
     print(f"\nTranscribing and analyzing with Mistral AI...")
     try:
-        client = Mistral(api_key=api_key)
+        client = _get_mistral_client(api_key)
         with open(path, "rb") as f:
             trans = client.audio.transcriptions.complete(
                 model="voxtral-mini-latest",
@@ -2638,21 +2992,18 @@ def _build_main_menu() -> str:
 
 
 def run_main_menu() -> bool:
-    """Show main menu and return chosen option (1–3, or 9 for hidden developer menu). Returns False to exit."""
+    """Show main menu and return chosen option (1–3, or 9 for hidden developer menu). Returns False to exit.
+    Invalid input re-prompts under the menu already on screen (as _run_submenu does)."""
     _clear_screen()
-    print(_build_main_menu())
-    choice = _prompt_choice("Select an option (1–3): ", 9)
-    if choice == 0:
+    _emit([_build_main_menu()])
+    while True:
+        choice = _prompt_choice("Select an option (1–3): ", 9)
+        if choice in (1, 2, 3, 9):
+            break
         print("Invalid option. Please enter 1, 2, or 3.")
-        _pause()
-        return True
     if choice == 9:
         run_developer_menu()
         return True
-    if choice in (4, 5, 6, 7, 8):
-        print("Invalid option. Please enter 1, 2, or 3.")
-        _pause()
-        return True
     if choice == 3:
         return False
     if choice == 1:
@@ -2664,18 +3015,21 @@ def run_main_menu() -> bool:
 
 # --- Developer menu ---
 
-DEVELOPER_MENU = _menu_box(
-    "Developer menu",
-    [
-        ("  1. Back to main menu", True),
-    ],
-)
+@functools.cache
+def _developer_menu() -> str:
+    """Developer menu box, rendered on first use."""
+    return _menu_box(
+        "Developer menu",
+        [
+            ("  1. Back to main menu", True),
+        ],
+    )
 
 
 def run_developer_menu() -> bool:
     """Developer menu; returns True so caller skips pause."""
     _run_submenu(
-        DEVELOPER_MENU,
+        _developer_menu(),
         1,
         {},
     )
@@ -2684,21 +3038,24 @@ def run_developer_menu() -> bool:
 
 # --- Project Creation & Estimation ---
 
-PROJECT_MENU = _menu_box(
-    "           Project Creation & Estimation",
-    [
-        ("  1. Input project spec (get structured breakdown)", False),
-        ("  2. Sync breakdown to Jira", False),
-        ("  3. Ask about project status (natural language)", False),
-        ("  4. Back to main menu", True),
-    ],
-)
+@functools.cache
+def _project_menu() -> str:
+    """Project Creation & Estimation menu box, rendered on first use."""
+    return _menu_box(
+        "           Project Creation & Estimation",
+        [
+            ("  1. Input project spec (get structured breakdown)", False),
+            ("  2. Sync breakdown to Jira", False),
+            ("  3. Ask about project status (natural language)", False),
+            ("  4. Back to main menu", True),
+        ],
+    )
 
 
 def run_project_estimation_menu() -> None:
     """Sub-menu for project creation and estimation."""
     _run_submenu(
-        PROJECT_MENU,
+        _project_menu(),
         4,
         {
             1: lambda: print("\n[Placeholder] Input project spec — not yet implemented."),
@@ -2710,22 +3067,25 @@ def run_project_estimation_menu() -> None:
 
 # --- People Management & Coaching (includes 1:1 submenu) ---
 
-ONE_TO_ONE_MENU = _menu_box(
-    "           1:1 Recordings (Upload, View, Delete)",
-    [
-        ("  1. Summarize 1:1 recording", True),
-        ("  2. View 1:1 summaries by direct report", True),
-        ("  3. Delete a 1:1 summary by date", True),
-        ("  4. Purge all 1:1 summaries for a direct report", True),
-        ("  5. Back to previous menu", True),
-    ],
-)
+@functools.cache
+def _one_to_one_menu() -> str:
+    """1:1 recordings menu box, rendered on first use."""
+    return _menu_box(
+        "           1:1 Recordings (Upload, View, Delete)",
+        [
+            ("  1. Summarize 1:1 recording", True),
+            ("  2. View 1:1 summaries by direct report", True),
+            ("  3. Delete a 1:1 summary by date", True),
+            ("  4. Purge all 1:1 summaries for a direct report", True),
+            ("  5. Back to previous menu", True),
+        ],
+    )
 
 
 def run_one_to_one_menu() -> bool:
     """1:1 recordings submenu; returns True to skip pause."""
     _run_submenu(
-        ONE_TO_ONE_MENU,
+        _one_to_one_menu(),
         5,
         {
             1: _upload_one_to_one_recording,
@@ -2737,24 +3097,27 @@ def run_one_to_one_menu() -> bool:
     return True
 
 
-PEOPLE_MENU = _menu_box(
-    "           People Management & Coaching",
-    [
-        ("  1. Manage 1:1s", True),
-        ("  2. View 1:1 trends analysis", False),
-        ("  3. Get suggested follow-up topics", False),
-        ("  4. View milestone reminders (anniversaries, birthdays)", True, True),  # red
-        ("  5. Administer Direct Reports", True, True),  # red
-        ("  6. View management tips by date", True, True),  # red
-        ("  7. Back to main menu", True),
-    ],
-)
+@functools.cache
+def _people_menu() -> str:
+    """People Management & Coaching menu box, rendered on first use."""
+    return _menu_box(
+        "           People Management & Coaching",
+        [
+            ("  1. Manage 1:1s", True),
+            ("  2. View 1:1 trends analysis", False),
+            ("  3. Get suggested follow-up topics", False),
+            ("  4. View milestone reminders (anniversaries, birthdays)", True, True),  # red
+            ("  5. Administer Direct Reports", True, True),  # red
+            ("  6. View management tips by date", True, True),  # red
+            ("  7. Back to main menu", True),
+        ],
+    )
 
 
 def run_people_coaching_menu() -> None:
     """Sub-menu for people management and coaching."""
     _run_submenu(
-        PEOPLE_MENU,
+        _people_menu(),
         7,
         {
             1: run_one_to_one_menu,
@@ -2769,17 +3132,24 @@ def run_people_coaching_menu() -> None:
 
 # --- Administer Direct Reports ---
 
-DIRECT_REPORTS_MENU = _menu_box(
-    "Administer Direct Reports",
-    [
-        ("  1. Add direct report", True),
-        ("  2. List direct reports", True),
-        ("  3. Delete a direct report", True),
-        ("  4. Generate direct reports with Mistral AI", MISTRAL_AVAILABLE),
-        ("  5. Purge all direct reports", True),
-        ("  6. Back to previous menu", True),
-    ],
-)
+def _build_direct_reports_menu(mistral_available: bool) -> str:
+    """Build the direct reports menu (option 4 is greyed out when the Mistral SDK is missing)."""
+    return _menu_box(
+        "Administer Direct Reports",
+        [
+            ("  1. Add direct report", True),
+            ("  2. List direct reports", True),
+            ("  3. Delete a direct report", True),
+            ("  4. Generate direct reports with Mistral AI", mistral_available),
+            ("  5. Purge all direct reports", True),
+            ("  6. Back to previous menu", True),
+        ],
+    )
+
+
+def _direct_reports_menu() -> str:
+    """Direct reports menu box for the current Mistral SDK availability (backs DIRECT_REPORTS_MENU)."""
+    return _build_direct_reports_menu(_ensure_mistral_sdk())
 
 
 def run_direct_reports_menu() -> bool:
@@ -2790,11 +3160,12 @@ def run_direct_reports_menu() -> bool:
         3: _delete_direct_report,
         5: _purge_direct_reports,
     }
-    if MISTRAL_AVAILABLE:
+    mistral_available = _ensure_mistral_sdk()
+    if mistral_available:
         actions[4] = _generate_direct_reports_with_ai
     
     _run_submenu(
-        DIRECT_REPORTS_MENU,
+        _build_direct_reports_menu(mistral_available),
         6,
         actions,
     )
@@ -2807,9 +3178,18 @@ def run_direct_reports_menu() -> bool:
 
 def authenticate() -> bool:
     """Prompt for password; return True if correct."""
+    import getpass  # only needed when authentication is enabled
+    import hashlib
+    import hmac
+
     try:
         password = getpass.getpass("Password: ")
-        return password == _get_expected_password()
+        # Constant-time: == would return sooner the shorter the matching prefix. Digests are
+        # compared so both sides are always 32 bytes (compare_digest leaks a length mismatch)
+        return hmac.compare_digest(
+            hashlib.sha256(password.encode("utf-8")).digest(),
+            hashlib.sha256(_get_expected_password().encode("utf-8")).digest(),
+        )
     except (EOFError, KeyboardInterrupt):
         return False
 
@@ -2830,8 +3210,8 @@ def main() -> None:
 #        print("Authentication failed. Exiting.", file=sys.stderr)
 #        sys.exit(1)
     try:
-        while run_main_menu():
-            _clear_screen()
+        while run_main_menu():  # each pass clears the screen itself
+            pass
     except KeyboardInterrupt:
         print("\nExiting.")
         sys.exit(0)
@@ -13,6 +13,8 @@ from wingmanem.settings import (
     DIRECT_REPORT_GOALS_FILE,
     DIRECT_REPORTS_FILE,
     LEGACY_DIRECT_REPORT_COMP_DATA_FILE,
+    LEGACY_DIRECT_REPORTS_FILE,
+    LEGACY_MANAGEMENT_TIPS_FILE,
     MANAGEMENT_TIPS_FILE,
 )
 
@@ -84,8 +84,10 @@ def _env_bool(name: str, default: bool) -> bool:
 
 # --- Data paths (defaults: project cwd) ---
 DATABASE_PATH = _env_str("WINGMANEM_DATABASE_PATH", "wingmanem.db")
-DIRECT_REPORTS_FILE = _env_str("WINGMANEM_DIRECT_REPORTS_FILE", "direct_reports.json")
-MANAGEMENT_TIPS_FILE = _env_str("WINGMANEM_MANAGEMENT_TIPS_FILE", "management_tips.json")
+DIRECT_REPORTS_FILE = _env_str("WINGMANEM_DIRECT_REPORTS_FILE", "direct_reports.jsonl")
+LEGACY_DIRECT_REPORTS_FILE = _env_str("WINGMANEM_LEGACY_DIRECT_REPORTS_FILE", "direct_reports.json")
+MANAGEMENT_TIPS_FILE = _env_str("WINGMANEM_MANAGEMENT_TIPS_FILE", "management_tips.ndjson")
+LEGACY_MANAGEMENT_TIPS_FILE = _env_str("WINGMANEM_LEGACY_MANAGEMENT_TIPS_FILE", "management_tips.json")
 DIRECT_REPORT_GOALS_FILE = _env_str("WINGMANEM_DIRECT_REPORT_GOALS_FILE", "direct_report_goals.json")
 DIRECT_REPORT_COMP_DATA_FILE = _env_str(
     "WINGMANEM_DIRECT_REPORT_COMP_DATA_FILE", "direct_report_comp_data.json"